@@ -54,7 +54,12 @@ Options for Trajectory Reading
     First frame (in ps) to read from trajectory.  Default: ``0``.
 --end
     Last frame (in ps) to read from trajectory.  Default: Last frame in
-    :file:`${settings}_out_${system}.log`.
+    :file:`${settings}_out_${system}.log`.  The .log file is only read
+    if \--end is neither given via the command line nor via the
+    |config_file|.  Hence, if you analyze the same simulation many
+    times, you can set ``end`` in the
+    [submit.analysis.lintf2_ether.gmx] section of your |config_file| to
+    skip reading the (possibly large) .log file.
 --every
     Only use frame if t MOD dt == first time (in ps).  Default: ``1``.
 
@@ -110,6 +115,24 @@ Gromacs-Specifig Options
 --gmx-exe
     Name of the Gromacs executable.  Default: ``'gmx'``.
 
+Submission Options
+^^^^^^^^^^^^^^^^^^
+--submit-threads
+    Maximum number of jobs that are submitted concurrently.  By default,
+    all jobs are submitted one after another in a fixed order.  Values
+    greater than ``1`` submit independent jobs concurrently in an
+    undefined order.  Jobs on which other jobs depend are always
+    submitted one after another.  If the submission of a job fails, no
+    further jobs are submitted and all failed job scripts are reported.
+    Keep this number small to not overload the Slurm controller.
+    Default: ``1``.
+--skip-input-check
+    Do not check whether the input files required by the scripts
+    selected with \--scripts exist.  Each file check is a file system
+    access, which can be slow on network file systems.  Only use this
+    option if you are sure that the input files exist (or will exist
+    when the jobs start).
+
 Sbatch Options
 ^^^^^^^^^^^^^^
 You can provide arbitrary other options to this script.  All these other
@@ -140,7 +163,14 @@ preparation and analysis tasks.
 
 If input files required for the scripts selected with \--scripts cannot
 be found, the submission script will terminate with an error message
-before submitting the job(s) to the Slurm Workload Manager.
+before submitting the job(s) to the Slurm Workload Manager (unless
+\--skip-input-check is given).
+
+The job scripts are submitted with their absolute path in the directory
+of this submit script.  Thus, you can run this submit script from any
+working directory.  Note that earlier versions of this submit script
+submitted the job scripts with their file name relative to the working
+directory.
 """
 
 
@@ -152,12 +182,10 @@ __author__ = "Andreas Thum"
 
 # Standard libraries
 import argparse
-import copy
 import os
-import shlex
-import subprocess as subproc
 import sys
 import warnings
+from types import MappingProxyType
 
 
 FILE_ROOT = os.path.abspath(os.path.dirname(__file__))
@@ -171,7 +199,7 @@ sys.path.insert(1, PYTHON_DIR)
 # Third-party libraries
 import gmx  # noqa: E402
 import opthandler  # noqa: E402
-import strng  # noqa: E402
+import slurm  # noqa: E402
 
 
 ARG_PREC = 3  # Precision of floats parsed to batch scripts.
@@ -181,66 +209,111 @@ if not os.path.isdir(BASH_DIR):
         "No such directory: '{}'.  This might happen if you change the"
         " directory structure of this project".format(BASH_DIR)
     )
-REQUIRE_EDR = (
-    # `${settings}_out_${system}.edr`
-    "energy",
+ELECTRODE_SCRIPTS = frozenset(
+    {
+        # Scripts that require electrodes in the system.
+        "densmap-z_gra",
+        "msd_electrodes",
+    }
+)
+NUMBER_OPTIONS = frozenset(
+    {
+        # Number options for the --scripts argument.
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "4.1",
+        "4.2",
+        "5",
+        "6",
+        "7",
+    }
+)
+REQUIRE_EDR = frozenset(
+    {
+        # `${settings}_out_${system}.edr`
+        "energy",
+    }
 )
-REQUIRE_NDX = (
-    # `${system}.ndx`
-    "density-z_charge",
-    "density-z_mass",
-    "density-z_number",
-    "densmap-z_gra",
-    "densmap-z_NBT",
-    "densmap-z_OBT",
-    "densmap-z_OE",
-    "msd",
-    "msd_electrodes",
-    "msd_lateral-z",
-    "msd_parallel-z",
-    "msd_tensor",
-    "polystat",
-    "potential-z",
+REQUIRE_NDX = frozenset(
+    {
+        # `${system}.ndx`
+        "density-z_charge",
+        "density-z_mass",
+        "density-z_number",
+        "densmap-z_gra",
+        "densmap-z_NBT",
+        "densmap-z_OBT",
+        "densmap-z_OE",
+        "msd",
+        "msd_electrodes",
+        "msd_lateral-z",
+        "msd_parallel-z",
+        "msd_tensor",
+        "polystat",
+        "potential-z",
+    }
+)
+REQUIRE_TRR = frozenset(
+    {
+        # `${settings}_out_${system}.trr`
+        "densmap-z_gra",
+        "densmap-z_Li",
+        "densmap-z_NBT",
+        "densmap-z_OBT",
+        "densmap-z_OE",
+        "trjconv_whole",
+    }
 )
-REQUIRE_TRR = (
-    # `${settings}_out_${system}.trr`
-    "densmap-z_gra",
-    "densmap-z_Li",
-    "densmap-z_NBT",
-    "densmap-z_OBT",
-    "densmap-z_OE",
-    "trjconv_whole",
+REQUIRE_XTC_WRAPPED = frozenset(
+    {
+        # `${settings}_out_${system}_pbc_whole_mol.xtc`
+        "density-z_charge",
+        "density-z_mass",
+        "density-z_number",
+        "polystat",
+        "potential-z",
+        "rdf_ether-com",
+        "rdf_Li",
+        "rdf_Li-com",
+        "rdf_NBT",
+        "rdf_NTf2-com",
+        "rdf_OE",
+        "rdf_slab-z_Li",
+        "rdf_slab-z_NBT",
+        "rdf_slab-z_OE",
+        "trjconv_nojump",
+    }
 )
-REQUIRE_XTC_WRAPPED = (
-    # `${settings}_out_${system}_pbc_whole_mol.xtc`
-    "density-z_charge",
-    "density-z_mass",
-    "density-z_number",
-    "polystat",
-    "potential-z",
-    "rdf_ether-com",
-    "rdf_Li",
-    "rdf_Li-com",
-    "rdf_NBT",
-    "rdf_NTf2-com",
-    "rdf_OE",
-    "rdf_slab-z_Li",
-    "rdf_slab-z_NBT",
-    "rdf_slab-z_OE",
-    "trjconv_nojump",
+REQUIRE_XTC_UNWRAPPED = frozenset(
+    {
+        # `${settings}_out_${system}_pbc_whole_mol_nojump.xtc`
+        "msd",
+        "msd_electrodes",
+        "msd_lateral-z",
+        "msd_parallel-z",
+        "msd_tensor",
+    }
 )
-REQUIRE_XTC_UNWRAPPED = (
-    # `${settings}_out_${system}_pbc_whole_mol_nojump.xtc`
-    "msd",
-    "msd_electrodes",
-    "msd_lateral-z",
-    "msd_parallel-z",
-    "msd_tensor",
+SLAB_SCRIPTS = frozenset(
+    {
+        # Scripts that analyze a slab in xy plane.
+        "densmap-z_gra",
+        "densmap-z_Li",
+        "densmap-z_NBT",
+        "densmap-z_OBT",
+        "densmap-z_OE",
+        "rdf_slab-z_Li",
+        "rdf_slab-z_NBT",
+        "rdf_slab-z_OE",
+    }
 )
 
 
-def _assemble_submit_cmd(sbatch_opts, job_script):
-    """
+def _assemble_submit_cmd(sbatch_opts, job_script, parsable=False):
+    r"""
     Assemble a |Slurm| submit command.
 
     Parameters
@@ -249,104 +322,37 @@ def _assemble_submit_cmd(sbatch_opts, job_script):
         Dictionary containing options to parse to |sbatch|.
     job_script : str
         The job script to submit.
+    parsable : bool, optional
+        If ``True``, add the \--parsable option to the submit command so
+        that |sbatch| only prints the job ID (and the cluster name, if
+        any).
 
     Returns
     -------
-    submit_cmd : str
-        The submit command as one string.
-
-    Notes
-    -----
-    This function relies on global variables!
-    """
-    sbatch = "sbatch "
-    sbatch += opthandler.optdict2str(
-        sbatch_opts, skiped_opts=("None", "False"), dumped_vals=("True",)
-    )
-    submit = sbatch
-    if "job-name" not in sbatch_opts and "J" not in sbatch_opts:
-        sbatch_jobname = " --job-name " + gmx_infile_pattern + "_"
-        submit += sbatch_jobname + job_script
-    if "output" not in sbatch_opts and "o" not in sbatch_opts:
-        sbatch_output = " --output " + gmx_infile_pattern + "_"
-        submit += sbatch_output + job_script + "_slurm-%j.out"
-    submit += " " + job_script + ".sh " + posargs[job_script]
-    return submit
-
-
-def _submit_discretized(sbatch_opts, job_script, bins):
-    r"""
-    Submit a |Slurm| job script for each bin in `bins`.
-
-    This function implements the \--discretize option of this submit
-    script.
-
-    Parameters
-    ----------
-    sbatch_opts : dict
-        Dictionary containing options to parse to |sbatch|.
-    job_script : str
-        The job script which should be submitted for each bin in `bins`.
-        The job script must analyze a slab in xy plane.
-    bins : list or tuple
-        List containing the bin edges.
-
-    Returns
-    -------
-    n_jobs_submitted : int
-        The number of submitted jobs.
+    submit_cmd : list
+        The submit command as list of arguments that can be directly
+        parsed to :func:`slurm.submit` or :func:`slurm.submit_parsable`.
 
     Notes
     -----
     This function relies on global variables!
     """
-    posargs = {
-        "densmap-z_gra": posargs_general + posargs_trj + posargs_dist,
-        "densmap-z_Li": posargs_general + posargs_trj + posargs_dist,
-        "densmap-z_NBT": posargs_general + posargs_trj + posargs_dist,
-        "densmap-z_OBT": posargs_general + posargs_trj + posargs_dist,
-        "densmap-z_OE": posargs_general + posargs_trj + posargs_dist,
-        "rdf_slab-z_Li": posargs_general + posargs_trj + posargs_dist,
-        "rdf_slab-z_NBT": posargs_general + posargs_trj + posargs_dist,
-        "rdf_slab-z_OE": posargs_general + posargs_trj + posargs_dist,
-    }
-    if job_script not in posargs.keys():
-        raise ValueError(
-            "Invalid job script: '{}'.  The script does not analyze a slab in"
-            " xy plane".format(job_script)
-        )
-
-    sbatch = "sbatch "
-    sbatch += opthandler.optdict2str(
-        sbatch_opts, skiped_opts=("None", "False"), dumped_vals=("True",)
+    return slurm.job_cmd(
+        sbatch_opts,
+        JOB_SCRIPTS[job_script],
+        posargs[job_script],
+        gmx_infile_pattern + "_" + job_script,
+        parsable=parsable,
     )
-    submit = sbatch
-
-    n_jobs_submitted = 0
-    for i, zmax in enumerate(bins[1:], 1):
-        slab = [bins[i - 1], zmax]
-        slab_str = "_{:.{prec}f}-{:.{prec}f}nm".format(
-            slab[0], slab[1], prec=ARG_PREC
-        )
-        if "job-name" not in sbatch_opts and "J" not in sbatch_opts:
-            sbatch_jobname = " --job-name " + gmx_infile_pattern + "_"
-            submit += sbatch_jobname + job_script + slab_str
-        if "output" not in sbatch_opts and "o" not in sbatch_opts:
-            sbatch_output = " --output " + gmx_infile_pattern + "_"
-            submit += sbatch_output + job_script + slab_str + "_slurm-%j.out"
-        posargs_tmp = opthandler.posargs2str(
-            posargs[job_script] + slab, prec=ARG_PREC
-        )
-        submit += " " + job_script + ".sh " + posargs_tmp
-        subproc.check_output(shlex.split(submit))
-        n_jobs_submitted += 1
-    return n_jobs_submitted
 
 
 def _submit(sbatch_opts, job_script):
-    """
+    r"""
     Submit job scripts to the |Slurm| Workload Manager.
 
+    If \--discretize is given and `job_script` analyzes a slab in xy
+    plane, `job_script` is submitted once for each bin.
+
     Parameters
     ----------
     sbatch_opts : dict
@@ -364,22 +370,26 @@ def _submit(sbatch_opts, job_script):
     This function relies on global variables!
     """
     n_jobs_submitted = 0
-    if "gra" not in args["system"] and (
-        job_script == "msd_electrodes" or job_script == "densmap-z_gra"
-    ):
+    if "gra" not in args["system"] and job_script in ELECTRODE_SCRIPTS:
         print(
             "NOTE: '{}' will not be submitted because the system contains no"
             " electrodes".format(job_script)
         )
-    elif args["discretize"] and (
-        "densmap-z" in job_script or "rdf_slab-z" in job_script
-    ):
-        n_jobs_submitted += _submit_discretized(
-            sbatch_opts, job_script, bin_edges
+    elif args["discretize"] and job_script in SLAB_SCRIPTS:
+        # The last two positional arguments of all slab scripts are the
+        # lower and upper boundary of the slab.  They are replaced by
+        # the bin edges.
+        n_jobs_submitted += slurm.submit_discretized(
+            sbatch_opts,
+            JOB_SCRIPTS[job_script],
+            pa_dist,
+            gmx_infile_pattern + "_" + job_script,
+            bin_edges,
+            prec=ARG_PREC,
+            unit="nm",
         )
     else:
-        submit = _assemble_submit_cmd(sbatch_opts, job_script)
-        subproc.check_output(shlex.split(submit))
+        slurm.submit(_assemble_submit_cmd(sbatch_opts, job_script))
         n_jobs_submitted += 1
     return n_jobs_submitted
 
@@ -445,7 +455,7 @@ if __name__ == "__main__":  # noqa: C901
         required=False,
         default=None,
         help=(
-            "First frame (in ps) to read from trajectory.  Default: Last frame"
+            "Last frame (in ps) to read from trajectory.  Default: Last frame"
             " in SETTINGS_out_SYSTEM.log."
         ),
     )
@@ -581,6 +591,28 @@ if __name__ == "__main__":  # noqa: C901
         default="gmx",
         help="Name of the Gromacs executable.  Default: %(default)s.",
     )
+    parser_submit = parser.add_argument_group(title="Submission Options")
+    parser_submit.add_argument(
+        "--submit-threads",
+        type=int,
+        required=False,
+        default=1,
+        help=(
+            "Maximum number of jobs that are submitted concurrently.  Values"
+            " greater than 1 submit independent jobs concurrently in an"
+            " undefined order.  Default: %(default)s."
+        ),
+    )
+    parser_submit.add_argument(
+        "--skip-input-check",
+        required=False,
+        default=False,
+        action="store_true",
+        help=(
+            "Do not check whether the input files required by the scripts"
+            " selected with --scripts exist."
+        ),
+    )
     opts = opthandler.get_opts(
         argparser=parser,
         secs_known=(
@@ -598,9 +630,12 @@ if __name__ == "__main__":  # noqa: C901
     )
     args = opts["submit"]
     args_sbatch = opts["sbatch"]
-    args_sbatch_no_dep = copy.deepcopy(args_sbatch)
+    # Read-only, because the option dicts are shared by many jobs.
+    args_sbatch_no_dep = args_sbatch.copy()
     args_sbatch_no_dep.pop("dependency", None)
     args_sbatch_no_dep.pop("d", None)
+    args_sbatch = MappingProxyType(args_sbatch)
+    args_sbatch_no_dep = MappingProxyType(args_sbatch_no_dep)
 
     gmx_infile_pattern = args["settings"] + "_" + args["system"]
     gmx_outfile_pattern = args["settings"] + "_out_" + args["system"]
@@ -612,8 +647,50 @@ if __name__ == "__main__":  # noqa: C901
     XTC_FILE_WRAPPED = gmx_outfile_pattern + "_pbc_whole_mol.xtc"
     XTC_FILE_UNWRAPPED = gmx_outfile_pattern + "_pbc_whole_mol_nojump.xtc"
     NDX_FILE = args["system"] + ".ndx"
+    # Split the script selection only once instead of creating a new
+    # list for every membership test.
+    scripts = frozenset(args["scripts"].split())
 
     print("Processing parsed arguments...")
+    # Map the names of all job scripts (without file extension) in the
+    # directory of this submit script to their absolute paths.  The
+    # directory is listed only once and only when this script is run.
+    with os.scandir(FILE_ROOT) as entries:
+        JOB_SCRIPTS = {
+            os.path.splitext(entry.name)[0]: entry.path
+            for entry in entries
+            if entry.name.endswith(".sh") and entry.is_file()
+        }
+    # Reject invalid script selections before doing anything else.
+    scripts_invalid = scripts.difference(NUMBER_OPTIONS, JOB_SCRIPTS)
+    if scripts_invalid:
+        raise ValueError(
+            "Invalid choice(s) for --scripts: {}".format(
+                ", ".join(sorted(scripts_invalid))
+            )
+        )
+    # Check all option values before reading any file.
+    if args["submit_threads"] < 1:
+        raise ValueError(
+            "--submit-threads ({}) must be greater than"
+            " zero".format(args["submit_threads"])
+        )
+    if args["slabwidth"] <= 0:
+        raise ValueError(
+            "--slabwidth ({}) must be greater than"
+            " zero".format(args["slabwidth"])
+        )
+    if args["discretize"] and (
+        scripts.isdisjoint(SLAB_SCRIPTS)
+        and "0" not in scripts  # All scripts.
+        and "2" not in scripts  # All slab scripts.
+        and "4.2" not in scripts  # All slab-z RDFs.
+        and "7" not in scripts  # All z-densmaps.
+    ):
+        raise ValueError(
+            "--discretize can only be used in conjunction with scripts that"
+            " analyze a slab in xy plane."
+        )
     if args["end"] is None:
         if not os.path.isfile(LOG_FILE):
             raise FileNotFoundError(
@@ -622,11 +699,6 @@ if __name__ == "__main__":  # noqa: C901
                 " --end manually".format(LOG_FILE)
             )
         args["end"] = gmx.get_last_time_from_log(LOG_FILE)
-    if args["slabwidth"] <= 0:
-        raise ValueError(
-            "--slabwidth ({}) must be greater than"
-            " zero".format(args["slabwidth"])
-        )
     if args["center_slab"]:
         if not os.path.isfile(GRO_FILE):
             raise FileNotFoundError(
@@ -657,29 +729,17 @@ if __name__ == "__main__":  # noqa: C901
                     args["zmax"], args["zmin"], args["slabwidth"]
                 )
             )
-        if (
-            "slab-z" not in args["scripts"]
-            and "densmap-z" not in args["scripts"]
-            and "0" not in args["scripts"].split()  # All scripts.
-            and "2" not in args["scripts"].split()  # All slab scripts.
-            and "4.2" not in args["scripts"].split()  # All slab-z RDFs.
-            and "7" not in args["scripts"].split()  # All z-densmaps.
-        ):
-            raise ValueError(
-                "--discretize can only be used in conjunction with scripts"
-                " that analyze a slab in xy plane."
-            )
-        edge = args["zmin"]
-        bin_edges = [edge]
-        while edge < args["zmax"]:
-            edge += args["slabwidth"]
-            bin_edges.append(edge)
+        bin_edges = gmx.get_bin_edges(
+            args["zmin"], args["zmax"], args["slabwidth"]
+        )
     if (
-        "density-z" in args["scripts"]
-        or "potential-z" in args["scripts"]
-        or "0" in args["scripts"].split()  # All scripts.
-        or "1" in args["scripts"].split()  # All bulk scripts.
-        or "6" in args["scripts"].split()  # All z-profiles.
+        any(
+            script.startswith(("density-z", "potential-z"))
+            for script in scripts
+        )
+        or "0" in scripts  # All scripts.
+        or "1" in scripts  # All bulk scripts.
+        or "6" in scripts  # All z-profiles.
     ):
         if not os.path.isfile(GRO_FILE):
             raise FileNotFoundError(
@@ -690,52 +750,75 @@ if __name__ == "__main__":  # noqa: C901
     else:
         nbins = None
 
-    print("Checking if input files exist...")
-    files = {"run input": TPR_FILE}
-    for script in args["scripts"].split():
-        if script in REQUIRE_EDR:
-            files.setdefault("energy", EDR_FILE)
-        if script in REQUIRE_NDX:
-            files.setdefault("index", NDX_FILE)
-        if script in REQUIRE_TRR:
-            files.setdefault("full-precision trajectory", TRR_FILE)
-        if script in REQUIRE_XTC_WRAPPED:
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        if script in REQUIRE_XTC_UNWRAPPED:
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-        if script == "0" or script == "1":  # All (bulk) scripts.
-            files.setdefault("energy", EDR_FILE)
-            files.setdefault("full-precision trajectory", TRR_FILE)
-        elif script == "2":  # All slab scripts.
-            files.setdefault("index", NDX_FILE)
-            files.setdefault("full-precision trajectory", TRR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "3":  # All trjconv scripts.
-            files.setdefault("full-precision trajectory", TRR_FILE)
-        elif script == "4":  # All RDFs
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "4.1":  # All bulk RDFs.
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "4.2":  # All slab-z RDFs.
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "5":  # All MSDs.
-            files["index"] = NDX_FILE
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-        elif script == "6":  # All z-profiles.
-            files.setdefault("index", NDX_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "7":  # All z-densmaps.
-            files.setdefault("index", NDX_FILE)
-            files.setdefault("full-precision trajectory", TRR_FILE)
-    for filetype, filename in files.items():
-        if not os.path.isfile(filename):
-            raise FileNotFoundError(
-                "No such file: '{}' ({} file)".format(filename, filetype)
-            )
+    if not args["skip_input_check"]:
+        print("Checking if input files exist...")
+        files = {"run input": TPR_FILE}
+        for script in args["scripts"].split():
+            if script in REQUIRE_EDR:
+                files.setdefault("energy", EDR_FILE)
+            if script in REQUIRE_NDX:
+                files.setdefault("index", NDX_FILE)
+            if script in REQUIRE_TRR:
+                files.setdefault("full-precision trajectory", TRR_FILE)
+            if script in REQUIRE_XTC_WRAPPED:
+                files.setdefault(
+                    "wrapped compressed trajectory", XTC_FILE_WRAPPED
+                )
+            if script in REQUIRE_XTC_UNWRAPPED:
+                files.setdefault(
+                    "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
+                )
+            if script == "0" or script == "1":  # All (bulk) scripts.
+                files.setdefault("energy", EDR_FILE)
+                files.setdefault("full-precision trajectory", TRR_FILE)
+            elif script == "2":  # All slab scripts.
+                files.setdefault("index", NDX_FILE)
+                files.setdefault("full-precision trajectory", TRR_FILE)
+                files.setdefault(
+                    "wrapped compressed trajectory", XTC_FILE_WRAPPED
+                )
+            elif script == "3":  # All trjconv scripts.
+                files.setdefault("full-precision trajectory", TRR_FILE)
+            elif script == "4":  # All RDFs
+                files.setdefault(
+                    "wrapped compressed trajectory", XTC_FILE_WRAPPED
+                )
+            elif script == "4.1":  # All bulk RDFs.
+                files.setdefault(
+                    "wrapped compressed trajectory", XTC_FILE_WRAPPED
+                )
+            elif script == "4.2":  # All slab-z RDFs.
+                files.setdefault(
+                    "wrapped compressed trajectory", XTC_FILE_WRAPPED
+                )
+            elif script == "5":  # All MSDs.
+                files["index"] = NDX_FILE
+                files.setdefault(
+                    "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
+                )
+            elif script == "6":  # All z-profiles.
+                files.setdefault("index", NDX_FILE)
+                files.setdefault(
+                    "wrapped compressed trajectory", XTC_FILE_WRAPPED
+                )
+            elif script == "7":  # All z-densmaps.
+                files.setdefault("index", NDX_FILE)
+                files.setdefault("full-precision trajectory", TRR_FILE)
+        # All input files are expected in the current working
+        # directory.  List this directory only once instead of calling
+        # stat for each input file, which can be slow on network file
+        # systems.  Fall back to `os.path.isfile` for files that are
+        # not found this way (e.g. because the file name contains a
+        # directory).
+        with os.scandir() as entries:
+            files_present = {
+                entry.name for entry in entries if entry.is_file()
+            }
+        for filetype, filename in files.items():
+            if filename not in files_present and not os.path.isfile(filename):
+                raise FileNotFoundError(
+                    "No such file: '{}' ({} file)".format(filename, filetype)
+                )
 
     print("Preparing positional arguments for the slurm job scripts...")
     gmx_lmod = os.path.abspath(
@@ -761,169 +844,182 @@ if __name__ == "__main__":  # noqa: C901
     posargs_msd = [args["beginfit"], args["endfit"], args["restart"]]
     posargs_dist = [args["binwidth"]]
     posargs_slab = [args["zmin"], args["zmax"]]
+    # Format the positional arguments only once and build the positional
+    # arguments of the single job scripts from shared, pre-formatted
+    # lists.  The lists are never modified in place, so the job scripts
+    # can share the same list objects.
+    pa_general = opthandler.posargs2list(posargs_general, prec=ARG_PREC)
+    pa_trj = pa_general + opthandler.posargs2list(posargs_trj, prec=ARG_PREC)
+    pa_trj_short = pa_trj[: len(pa_general) + 2]  # Without --every.
+    pa_msd = pa_trj_short + opthandler.posargs2list(posargs_msd, prec=ARG_PREC)
+    pa_nbins = pa_trj + opthandler.posargs2list([nbins], prec=ARG_PREC)
+    pa_dist = pa_trj + opthandler.posargs2list(posargs_dist, prec=ARG_PREC)
+    pa_slab = pa_dist + opthandler.posargs2list(posargs_slab, prec=ARG_PREC)
     # Position arguments must be in the right order for each job script.
     posargs = {
-        "density-z_charge": posargs_general + posargs_trj + [nbins],
-        "density-z_mass": posargs_general + posargs_trj + [nbins],
-        "density-z_number": posargs_general + posargs_trj + [nbins],
-        "densmap-z_gra": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "densmap-z_Li": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "densmap-z_NBT": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "densmap-z_OBT": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "densmap-z_OE": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "energy": posargs_general + posargs_trj[:2],
-        "make_ndx": posargs_general,
-        "msd": posargs_general + posargs_trj[:2] + posargs_msd,
-        "msd_electrodes": posargs_general + posargs_trj[:2] + posargs_msd,
-        "msd_lateral-z": posargs_general + posargs_trj[:2] + posargs_msd,
-        "msd_parallel-z": posargs_general + posargs_trj[:2] + posargs_msd,
-        "msd_tensor": posargs_general + posargs_trj[:2] + posargs_msd,
-        "polystat": posargs_general + posargs_trj,
-        "potential-z": posargs_general + posargs_trj + [nbins],
-        "rdf_ether-com": posargs_general + posargs_trj + posargs_dist,
-        "rdf_Li": posargs_general + posargs_trj + posargs_dist,
-        "rdf_Li-com": posargs_general + posargs_trj + posargs_dist,
-        "rdf_NBT": posargs_general + posargs_trj + posargs_dist,
-        "rdf_NTf2-com": posargs_general + posargs_trj + posargs_dist,
-        "rdf_OE": posargs_general + posargs_trj + posargs_dist,
-        "rdf_slab-z_Li": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "rdf_slab-z_NBT": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "rdf_slab-z_OE": (
-            posargs_general + posargs_trj + posargs_dist + posargs_slab
-        ),
-        "trjconv_nojump": posargs_general + posargs_trj,
-        "trjconv_whole": posargs_general + posargs_trj,
-    }
-    posargs = {
-        k: opthandler.posargs2str(v, prec=ARG_PREC) for k, v in posargs.items()
+        "density-z_charge": pa_nbins,
+        "density-z_mass": pa_nbins,
+        "density-z_number": pa_nbins,
+        "densmap-z_gra": pa_slab,
+        "densmap-z_Li": pa_slab,
+        "densmap-z_NBT": pa_slab,
+        "densmap-z_OBT": pa_slab,
+        "densmap-z_OE": pa_slab,
+        "energy": pa_trj_short,
+        "make_ndx": pa_general,
+        "msd": pa_msd,
+        "msd_electrodes": pa_msd,
+        "msd_lateral-z": pa_msd,
+        "msd_parallel-z": pa_msd,
+        "msd_tensor": pa_msd,
+        "polystat": pa_trj,
+        "potential-z": pa_nbins,
+        "rdf_ether-com": pa_dist,
+        "rdf_Li": pa_dist,
+        "rdf_Li-com": pa_dist,
+        "rdf_NBT": pa_dist,
+        "rdf_NTf2-com": pa_dist,
+        "rdf_OE": pa_dist,
+        "rdf_slab-z_Li": pa_slab,
+        "rdf_slab-z_NBT": pa_slab,
+        "rdf_slab-z_OE": pa_slab,
+        "trjconv_nojump": pa_trj,
+        "trjconv_whole": pa_trj,
     }
+    # Names of all job scripts in a fixed order.
+    batch_scripts = tuple(posargs)
+    for batch_script in batch_scripts:
+        if batch_script not in JOB_SCRIPTS:
+            raise FileNotFoundError(
+                "No such file: '{}'.  This might happen if you change the"
+                " directory structure of this project".format(
+                    os.path.join(FILE_ROOT, batch_script + ".sh")
+                )
+            )
 
     print("Submitting job(s) to Slurm...")
     n_scripts_submitted = 0
+    # Jobs that other jobs depend on are submitted immediately, because
+    # their job IDs are required for the submission of the dependent
+    # jobs.  All other jobs are only collected as (sbatch options, job
+    # script) pairs and submitted together at the end (concurrently if
+    # --submit-threads is greater than 1).
+    jobs = []
     # Submit single scripts by name.
-    for batch_script in posargs.keys():
-        if batch_script in args["scripts"].split():
-            n_scripts_submitted += _submit(args_sbatch, batch_script)
+    for batch_script in batch_scripts:
+        if batch_script in scripts:
+            jobs.append((args_sbatch, batch_script))
     # Submit multiple scripts by number.
-    if "0" in args["scripts"].split() or "1" in args["scripts"].split():
+    if "0" in scripts or "1" in scripts:
         # All scripts (0) or All bulk scripts (1).
         # make_ndx
-        submit = _assemble_submit_cmd(args_sbatch, "make_ndx")
-        job_id_make_ndx = subproc.check_output(shlex.split(submit))
-        job_id_make_ndx = strng.extract_ints_from_str(job_id_make_ndx)
-        job_id_make_ndx = job_id_make_ndx[0]
-        args_sbatch_dep_make_ndx = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_make_ndx["dependency"] = "afterok:{}".format(
-            job_id_make_ndx
+        job_id_make_ndx = slurm.submit_parsable(
+            _assemble_submit_cmd(args_sbatch, "make_ndx", parsable=True)
+        )
+        args_sbatch_dep_make_ndx = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_make_ndx),
+            }
         )
         n_scripts_submitted += 1
         # trjconv_whole
-        submit = _assemble_submit_cmd(
-            args_sbatch_dep_make_ndx, "trjconv_whole"
-        )
-        job_id_trjconv_whole = subproc.check_output(shlex.split(submit))
-        job_id_trjconv_whole = strng.extract_ints_from_str(
-            job_id_trjconv_whole
+        job_id_trjconv_whole = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch_dep_make_ndx, "trjconv_whole", parsable=True
+            )
         )
-        job_id_trjconv_whole = job_id_trjconv_whole[0]
-        args_sbatch_dep_trjconv_whole = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_trjconv_whole["dependency"] = "afterok:{}".format(
-            job_id_trjconv_whole
+        args_sbatch_dep_trjconv_whole = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_trjconv_whole),
+            }
         )
         n_scripts_submitted += 1
         # trjconv_nojump
-        submit = _assemble_submit_cmd(
-            args_sbatch_dep_trjconv_whole, "trjconv_nojump"
-        )
-        job_id_trjconv_nojump = subproc.check_output(shlex.split(submit))
-        job_id_trjconv_nojump = strng.extract_ints_from_str(
-            job_id_trjconv_nojump
+        job_id_trjconv_nojump = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch_dep_trjconv_whole, "trjconv_nojump", parsable=True
+            )
         )
-        job_id_trjconv_nojump = job_id_trjconv_nojump[0]
-        args_sbatch_dep_trjconv_nojump = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_trjconv_nojump["dependency"] = "afterok:{}".format(
-            job_id_trjconv_nojump
+        args_sbatch_dep_trjconv_nojump = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_trjconv_nojump),
+            }
         )
         n_scripts_submitted += 1
-        for batch_script in posargs.keys():
-            if "0" not in args["scripts"].split() and (
-                "densmap-z" in batch_script or "rdf_slab-z" in batch_script
-            ):
+        # Map each job script to the sbatch options that contain the
+        # dependency on the job that creates its input.  The REQUIRE_*
+        # sets overlap, so the order of the updates matters: An
+        # unwrapped trajectory takes precedence over a wrapped
+        # trajectory, which takes precedence over an index file.
+        sbatch_opts_dep = dict.fromkeys(REQUIRE_NDX, args_sbatch_dep_make_ndx)
+        sbatch_opts_dep.update(
+            dict.fromkeys(REQUIRE_XTC_WRAPPED, args_sbatch_dep_trjconv_whole)
+        )
+        sbatch_opts_dep.update(
+            dict.fromkeys(
+                REQUIRE_XTC_UNWRAPPED, args_sbatch_dep_trjconv_nojump
+            )
+        )
+        for batch_script in batch_scripts:
+            if "0" not in scripts and batch_script in SLAB_SCRIPTS:
                 # Only bulk scripts.
                 continue
             if batch_script in ("make_ndx", "trjconv_whole", "trjconv_nojump"):
                 continue
-            elif batch_script in REQUIRE_XTC_UNWRAPPED:
-                sbatch_opts = args_sbatch_dep_trjconv_nojump
-            elif batch_script in REQUIRE_XTC_WRAPPED:
-                sbatch_opts = args_sbatch_dep_trjconv_whole
-            elif batch_script in REQUIRE_NDX:
-                sbatch_opts = args_sbatch_dep_make_ndx
-            else:
-                sbatch_opts = args_sbatch
-            n_scripts_submitted += _submit(sbatch_opts, batch_script)
-    if "2" in args["scripts"].split():
-        # All slab scripts.
-        for batch_script in posargs.keys():
-            if "densmap-z" in batch_script or "rdf_slab-z" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "3" in args["scripts"].split():
+            sbatch_opts = sbatch_opts_dep.get(batch_script, args_sbatch)
+            jobs.append((sbatch_opts, batch_script))
+    if "3" in scripts:
         # All trjconv scripts.
         # trjconv_whole
-        submit = _assemble_submit_cmd(args_sbatch, "trjconv_whole")
-        job_id = subproc.check_output(shlex.split(submit))
-        job_id = strng.extract_ints_from_str(job_id)[0]
-        args_sbatch_dep = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep["dependency"] = "afterok:{}".format(job_id)
+        job_id = slurm.submit_parsable(
+            _assemble_submit_cmd(args_sbatch, "trjconv_whole", parsable=True)
+        )
+        args_sbatch_dep = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id),
+            }
+        )
         n_scripts_submitted += 1
         # trjconv_nojump
-        submit = _assemble_submit_cmd(args_sbatch_dep, "trjconv_nojump")
-        subproc.check_output(shlex.split(submit))
+        slurm.submit(_assemble_submit_cmd(args_sbatch_dep, "trjconv_nojump"))
         n_scripts_submitted += 1
-    if "4" in args["scripts"].split():
+    # Number options that select job scripts without dependencies.  The
+    # job scripts of each option are determined only once and in the
+    # same order as they appear in `posargs`.
+    selections = {
+        # All slab scripts.
+        "2": [bs for bs in batch_scripts if bs in SLAB_SCRIPTS],
         # All RDFs.
-        for batch_script in posargs.keys():
-            if "rdf" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "4.1" in args["scripts"].split():
+        "4": [bs for bs in batch_scripts if bs.startswith("rdf")],
         # All bulk RDFs.
-        for batch_script in posargs.keys():
-            if "rdf" in batch_script and "slab-z" not in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "4.2" in args["scripts"].split():
+        "4.1": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("rdf") and not bs.startswith("rdf_slab-z")
+        ],
         # All slab-z RDFs.
-        for batch_script in posargs.keys():
-            if "rdf_slab-z" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "5" in args["scripts"].split():
+        "4.2": [bs for bs in batch_scripts if bs.startswith("rdf_slab-z")],
         # All MSDs.
-        for batch_script in posargs.keys():
-            if "msd" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "6" in args["scripts"].split():
-        # All z-profiles
-        for batch_script in posargs.keys():
-            if "density-z" in batch_script or "potential-z" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "7" in args["scripts"].split():
+        "5": [bs for bs in batch_scripts if bs.startswith("msd")],
+        # All z-profiles.
+        "6": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith(("density-z", "potential-z"))
+        ],
         # All z-densmaps.
-        for batch_script in posargs.keys():
-            if "densmap-z" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
+        "7": [bs for bs in batch_scripts if bs.startswith("densmap-z")],
+    }
+    for selector, selection in selections.items():
+        if selector in scripts:
+            jobs.extend((args_sbatch, bs) for bs in selection)
+    n_scripts_submitted += slurm.submit_jobs(
+        _submit, jobs, max_workers=args["submit_threads"]
+    )
     print("Submitted {} jobs".format(n_scripts_submitted))
     if n_scripts_submitted == 0:
         warnings.warn("No script submitted", UserWarning)
@@ -160,6 +160,24 @@ Python-Specifig Options
     Path to the MDTools installation.  Default:
     ``'${HOME}/.local/lib/python3.9/site-packages/mdtools'``.
 
+Submission Options
+^^^^^^^^^^^^^^^^^^
+--submit-threads
+    Maximum number of jobs that are submitted concurrently.  By default,
+    all jobs are submitted one after another in a fixed order.  Values
+    greater than ``1`` submit independent jobs concurrently in an
+    undefined order.  Jobs on which other jobs depend are always
+    submitted one after another.  If the submission of a job fails, no
+    further jobs are submitted and all failed job scripts are reported.
+    Keep this number small to not overload the Slurm controller.
+    Default: ``1``.
+--skip-input-check
+    Do not check whether the input files required by the scripts
+    selected with \--scripts exist.  Each file check is a file system
+    access, which can be slow on network file systems.  Only use this
+    option if you are sure that the input files exist (or will exist
+    when the jobs start).
+
 Sbatch Options
 ^^^^^^^^^^^^^^
 You can provide arbitrary other options to this script.  All these other
@@ -190,7 +208,14 @@ preparation and analysis tasks.
 
 If input files required for the scripts selected with \--scripts cannot
 be found, the submission script will terminate with an error message
-before submitting the job(s) to the Slurm Workload Manager.
+before submitting the job(s) to the Slurm Workload Manager (unless
+\--skip-input-check is given).
+
+The job scripts are submitted with their absolute path in the directory
+of this submit script.  Thus, you can run this submit script from any
+working directory.  Note that earlier versions of this submit script
+submitted the job scripts with their file name relative to the working
+directory.
 """
 
 
@@ -202,12 +227,10 @@ __author__ = "Andreas Thum"
 
 # Standard libraries
 import argparse
-import copy
 import os
-import shlex
-import subprocess as subproc
 import sys
 import warnings
+from types import MappingProxyType
 
 
 FILE_ROOT = os.path.abspath(os.path.dirname(__file__))
@@ -221,7 +244,7 @@ sys.path.insert(1, PYTHON_DIR)
 # Third-party libraries
 import gmx  # noqa: E402
 import opthandler  # noqa: E402
-import strng  # noqa: E402
+import slurm  # noqa: E402
 
 
 ARG_PREC = 2  # Precision of floats parsed to batch scripts.
@@ -231,160 +254,269 @@ if not os.path.isdir(BASH_DIR):
         "No such directory: '{}'.  This might happen if you change the"
         " directory structure of this project".format(BASH_DIR)
     )
-REQUIRE_TPR = (
-    # `${settings}_${system}.tpr`
-    "axial_hex_dist_1nn_Li",
-    "axial_hex_dist_1nn_NBT",
-    "axial_hex_dist_1nn_OBT",
-    "axial_hex_dist_1nn_OE",
-    "axial_hex_dist_2nn_Li",
-    "axial_hex_dist_2nn_NBT",
-    "axial_hex_dist_2nn_OBT",
-    "axial_hex_dist_2nn_OE",
-    "contact_hist_Li-O",
-    "contact_hist_Li-OBT",
-    "contact_hist_Li-OE",
-    "contact_hist_O-Li",
-    "contact_hist_OBT-Li",
-    "contact_hist_OE-Li",
-    "contact_hist_at_pos_change_Li-OBT",
-    "contact_hist_at_pos_change_Li-OE",
-    "contact_hist_slab-z_Li-OBT",
-    "contact_hist_slab-z_Li-OE",
-    "create_mda_universe",
-    "discrete-hex_Li",
-    "discrete-hex_NBT",
-    "discrete-hex_OBT",
-    "discrete-hex_OE",
-    "discrete-z_Li",
-    "lifetime_autocorr_Li-ether",
-    "lifetime_autocorr_Li-NTf2",
-    "lifetime_autocorr_Li-OBT",
-    "lifetime_autocorr_Li-OE",
-    "lig_change_at_pos_change_Li-OBT",
-    "lig_change_at_pos_change_Li-OE",
-    "lig_change_at_pos_change_blocks_Li-OBT",
-    "lig_change_at_pos_change_blocks_Li-OE",
-    "lig_change_at_pos_change_blocks_hist_Li-OBT",
-    "lig_change_at_pos_change_blocks_hist_Li-OE",
-    "msd_ether",
-    "msd_Li",
-    "msd_NBT",
-    "msd_NTf2",
-    "msd_OBT",
-    "msd_OE",
-    "msd_layer_ether",
-    "msd_layer_Li",
-    "msd_layer_NBT",
-    "msd_layer_NTf2",
-    "msd_layer_OBT",
-    "msd_layer_OE",
-    "msd_at_coord_change_Li-ether",
-    "msd_at_coord_change_Li-NTf2",
-    "renewal_events_Li-ether",
-    "renewal_events_Li-NTf2",
-    "topo_map_Li-OBT",
-    "topo_map_Li-OE",
+ELECTRODE_SCRIPTS = frozenset(
+    {
+        # Scripts that require electrodes in the system.
+        "axial_hex_dist_1nn_Li",
+        "axial_hex_dist_1nn_NBT",
+        "axial_hex_dist_1nn_OBT",
+        "axial_hex_dist_1nn_OE",
+        "axial_hex_dist_2nn_Li",
+        "axial_hex_dist_2nn_NBT",
+        "axial_hex_dist_2nn_OBT",
+        "axial_hex_dist_2nn_OE",
+        "discrete-hex_Li",
+        "discrete-hex_NBT",
+        "discrete-hex_OBT",
+        "discrete-hex_OE",
+    }
+)
+REQUIRE_TPR = frozenset(
+    {
+        # `${settings}_${system}.tpr`
+        "axial_hex_dist_1nn_Li",
+        "axial_hex_dist_1nn_NBT",
+        "axial_hex_dist_1nn_OBT",
+        "axial_hex_dist_1nn_OE",
+        "axial_hex_dist_2nn_Li",
+        "axial_hex_dist_2nn_NBT",
+        "axial_hex_dist_2nn_OBT",
+        "axial_hex_dist_2nn_OE",
+        "contact_hist_Li-O",
+        "contact_hist_Li-OBT",
+        "contact_hist_Li-OE",
+        "contact_hist_O-Li",
+        "contact_hist_OBT-Li",
+        "contact_hist_OE-Li",
+        "contact_hist_at_pos_change_Li-OBT",
+        "contact_hist_at_pos_change_Li-OE",
+        "contact_hist_slab-z_Li-OBT",
+        "contact_hist_slab-z_Li-OE",
+        "create_mda_universe",
+        "discrete-hex_Li",
+        "discrete-hex_NBT",
+        "discrete-hex_OBT",
+        "discrete-hex_OE",
+        "discrete-z_Li",
+        "lifetime_autocorr_Li-ether",
+        "lifetime_autocorr_Li-NTf2",
+        "lifetime_autocorr_Li-OBT",
+        "lifetime_autocorr_Li-OE",
+        "lig_change_at_pos_change_Li-OBT",
+        "lig_change_at_pos_change_Li-OE",
+        "lig_change_at_pos_change_blocks_Li-OBT",
+        "lig_change_at_pos_change_blocks_Li-OE",
+        "lig_change_at_pos_change_blocks_hist_Li-OBT",
+        "lig_change_at_pos_change_blocks_hist_Li-OE",
+        "msd_ether",
+        "msd_Li",
+        "msd_NBT",
+        "msd_NTf2",
+        "msd_OBT",
+        "msd_OE",
+        "msd_layer_ether",
+        "msd_layer_Li",
+        "msd_layer_NBT",
+        "msd_layer_NTf2",
+        "msd_layer_OBT",
+        "msd_layer_OE",
+        "msd_at_coord_change_Li-ether",
+        "msd_at_coord_change_Li-NTf2",
+        "renewal_events_Li-ether",
+        "renewal_events_Li-NTf2",
+        "topo_map_Li-OBT",
+        "topo_map_Li-OE",
+    }
+)
+REQUIRE_XTC_WRAPPED = frozenset(
+    {
+        # `${settings}_out_${system}_pbc_whole_mol.xtc`
+        "axial_hex_dist_1nn_Li",
+        "axial_hex_dist_1nn_NBT",
+        "axial_hex_dist_1nn_OBT",
+        "axial_hex_dist_1nn_OE",
+        "axial_hex_dist_2nn_Li",
+        "axial_hex_dist_2nn_NBT",
+        "axial_hex_dist_2nn_OBT",
+        "axial_hex_dist_2nn_OE",
+        "contact_hist_Li-O",
+        "contact_hist_Li-OBT",
+        "contact_hist_Li-OE",
+        "contact_hist_O-Li",
+        "contact_hist_OBT-Li",
+        "contact_hist_OE-Li",
+        "contact_hist_at_pos_change_Li-OBT",
+        "contact_hist_at_pos_change_Li-OE",
+        "contact_hist_slab-z_Li-OBT",
+        "contact_hist_slab-z_Li-OE",
+        "create_mda_universe",
+        "discrete-hex_Li",
+        "discrete-hex_NBT",
+        "discrete-hex_OBT",
+        "discrete-hex_OE",
+        "discrete-z_Li",
+        "lifetime_autocorr_Li-ether",
+        "lifetime_autocorr_Li-NTf2",
+        "lifetime_autocorr_Li-OBT",
+        "lifetime_autocorr_Li-OE",
+        "lig_change_at_pos_change_Li-OBT",
+        "lig_change_at_pos_change_Li-OE",
+        "lig_change_at_pos_change_blocks_Li-OBT",
+        "lig_change_at_pos_change_blocks_Li-OE",
+        "lig_change_at_pos_change_blocks_hist_Li-OBT",
+        "lig_change_at_pos_change_blocks_hist_Li-OE",
+        "topo_map_Li-OBT",
+        "topo_map_Li-OE",
+    }
 )
-REQUIRE_XTC_WRAPPED = (
-    # `${settings}_out_${system}_pbc_whole_mol.xtc`
-    "axial_hex_dist_1nn_Li",
-    "axial_hex_dist_1nn_NBT",
-    "axial_hex_dist_1nn_OBT",
-    "axial_hex_dist_1nn_OE",
-    "axial_hex_dist_2nn_Li",
-    "axial_hex_dist_2nn_NBT",
-    "axial_hex_dist_2nn_OBT",
-    "axial_hex_dist_2nn_OE",
-    "contact_hist_Li-O",
-    "contact_hist_Li-OBT",
-    "contact_hist_Li-OE",
-    "contact_hist_O-Li",
-    "contact_hist_OBT-Li",
-    "contact_hist_OE-Li",
-    "contact_hist_at_pos_change_Li-OBT",
-    "contact_hist_at_pos_change_Li-OE",
-    "contact_hist_slab-z_Li-OBT",
-    "contact_hist_slab-z_Li-OE",
-    "create_mda_universe",
-    "discrete-hex_Li",
-    "discrete-hex_NBT",
-    "discrete-hex_OBT",
-    "discrete-hex_OE",
-    "discrete-z_Li",
-    "lifetime_autocorr_Li-ether",
-    "lifetime_autocorr_Li-NTf2",
-    "lifetime_autocorr_Li-OBT",
-    "lifetime_autocorr_Li-OE",
-    "lig_change_at_pos_change_Li-OBT",
-    "lig_change_at_pos_change_Li-OE",
-    "lig_change_at_pos_change_blocks_Li-OBT",
-    "lig_change_at_pos_change_blocks_Li-OE",
-    "lig_change_at_pos_change_blocks_hist_Li-OBT",
-    "lig_change_at_pos_change_blocks_hist_Li-OE",
-    "topo_map_Li-OBT",
-    "topo_map_Li-OE",
+REQUIRE_XTC_UNWRAPPED = frozenset(
+    {
+        # `${settings}_out_${system}_pbc_whole_mol_nojump.xtc`
+        "create_mda_universe",
+        "msd_ether",
+        "msd_Li",
+        "msd_NBT",
+        "msd_NTf2",
+        "msd_OBT",
+        "msd_OE",
+        "msd_layer_ether",
+        "msd_layer_Li",
+        "msd_layer_NBT",
+        "msd_layer_NTf2",
+        "msd_layer_OBT",
+        "msd_layer_OE",
+        "msd_at_coord_change_Li-ether",
+        "msd_at_coord_change_Li-NTf2",
+        "renewal_events_Li-ether",
+        "renewal_events_Li-NTf2",
+    }
 )
-REQUIRE_XTC_UNWRAPPED = (
-    # `${settings}_out_${system}_pbc_whole_mol_nojump.xtc`
-    "create_mda_universe",
-    "msd_ether",
-    "msd_Li",
-    "msd_NBT",
-    "msd_NTf2",
-    "msd_OBT",
-    "msd_OE",
-    "msd_layer_ether",
-    "msd_layer_Li",
-    "msd_layer_NBT",
-    "msd_layer_NTf2",
-    "msd_layer_OBT",
-    "msd_layer_OE",
-    "msd_at_coord_change_Li-ether",
-    "msd_at_coord_change_Li-NTf2",
-    "renewal_events_Li-ether",
-    "renewal_events_Li-NTf2",
+REQUIRE_DTRJ_DISCRETE_Z = frozenset(
+    {
+        # `${settings}_${system}_discrete-z_Li_dtrj.npy`
+        "discrete-z_Li_state_lifetime_discrete",
+        "renewal_events_Li-ether_state_lifetime",
+        "renewal_events_Li-ether_state_lifetime_discrete",
+        "renewal_events_Li-NTf2_state_lifetime",
+        "renewal_events_Li-NTf2_state_lifetime_discrete",
+    }
 )
-REQUIRE_DTRJ_DISCRETE_Z = (
-    # `${settings}_${system}_discrete-z_Li_dtrj.npy`
-    "discrete-z_Li_state_lifetime_discrete",
-    "renewal_events_Li-ether_state_lifetime",
-    "renewal_events_Li-ether_state_lifetime_discrete",
-    "renewal_events_Li-NTf2_state_lifetime",
-    "renewal_events_Li-NTf2_state_lifetime_discrete",
+REQUIRE_DTRJ_RENEWAL_ETHER = frozenset(
+    {
+        # `${settings}_${system}_renewal_events_Li-ether_dtrj.npy`
+        "renewal_events_Li-ether_state_lifetime",
+        "renewal_events_Li-ether_state_lifetime_discrete",
+    }
 )
-REQUIRE_DTRJ_RENEWAL_ETHER = (
-    # `${settings}_${system}_renewal_events_Li-ether_dtrj.npy`
-    "renewal_events_Li-ether_state_lifetime",
-    "renewal_events_Li-ether_state_lifetime_discrete",
+REQUIRE_DTRJ_RENEWAL_TFSI = frozenset(
+    {
+        # `${settings}_${system}_renewal_events_Li-NTf2_dtrj.npy`
+        "renewal_events_Li-NTf2_state_lifetime",
+        "renewal_events_Li-NTf2_state_lifetime_discrete",
+    }
 )
-REQUIRE_DTRJ_RENEWAL_TFSI = (
-    # `${settings}_${system}_renewal_events_Li-NTf2_dtrj.npy`
-    "renewal_events_Li-NTf2_state_lifetime",
-    "renewal_events_Li-NTf2_state_lifetime_discrete",
+REQUIRE_BIN_FILE = frozenset(
+    {
+        # `${settings}_${system}_density-z_number_Li_binsA.txt`
+        "contact_hist_at_pos_change_Li-OBT",
+        "contact_hist_at_pos_change_Li-OE",
+        "discrete-z_Li",
+        "lig_change_at_pos_change_Li-OBT",
+        "lig_change_at_pos_change_Li-OE",
+        "lig_change_at_pos_change_blocks_Li-OBT",
+        "lig_change_at_pos_change_blocks_Li-OE",
+        "lig_change_at_pos_change_blocks_hist_Li-OBT",
+        "lig_change_at_pos_change_blocks_hist_Li-OE",
+        "msd_layer_ether",
+        "msd_layer_Li",
+        "msd_layer_NBT",
+        "msd_layer_NTf2",
+        "msd_layer_OBT",
+        "msd_layer_OE",
+    }
 )
-REQUIRE_BIN_FILE = (
-    # `${settings}_${system}_density-z_number_Li_binsA.txt`
-    "contact_hist_at_pos_change_Li-OBT",
-    "contact_hist_at_pos_change_Li-OE",
-    "discrete-z_Li",
-    "lig_change_at_pos_change_Li-OBT",
-    "lig_change_at_pos_change_Li-OE",
-    "lig_change_at_pos_change_blocks_Li-OBT",
-    "lig_change_at_pos_change_blocks_Li-OE",
-    "lig_change_at_pos_change_blocks_hist_Li-OBT",
-    "lig_change_at_pos_change_blocks_hist_Li-OE",
-    "msd_layer_ether",
-    "msd_layer_Li",
-    "msd_layer_NBT",
-    "msd_layer_NTf2",
-    "msd_layer_OBT",
-    "msd_layer_OE",
+# Input files required by the scripts that are selected by number.  The
+# input files required by single scripts are listed in the REQUIRE_*
+# sets.  The file keys are resolved in the main part of this script.
+NUMBER_REQUIREMENTS = {
+    # All scripts.
+    "0": frozenset({"tpr", "xtc_wrapped", "xtc_unwrapped", "bin"}),
+    # All bulk scripts.
+    "1": frozenset({"tpr", "xtc_wrapped", "xtc_unwrapped", "bin"}),
+    # All slab scripts.
+    "2": frozenset({"tpr", "xtc_wrapped"}),
+    # All discrete-z_Li*.
+    "3": frozenset({"tpr", "xtc_wrapped", "bin"}),
+    # All hexagonal discretizations.
+    "4": frozenset({"tpr", "xtc_wrapped"}),
+    # All axial_hex_dist*.
+    "5": frozenset({"tpr", "xtc_wrapped"}),
+    # All contact histograms.
+    "6": frozenset({"tpr", "xtc_wrapped", "bin"}),
+    # All "normal" bulk contact histograms.
+    "6.1": frozenset({"tpr", "xtc_wrapped"}),
+    # All slab-z contact histograms.
+    "6.2": frozenset({"tpr", "xtc_wrapped"}),
+    # All contact_hist_at_pos_change*.
+    "6.3": frozenset({"tpr", "xtc_wrapped", "bin"}),
+    # All lig_change_at_pos_change*.
+    "7": frozenset({"tpr", "xtc_wrapped", "bin"}),
+    # All topological maps.
+    "8": frozenset({"tpr", "xtc_wrapped"}),
+    # All MSDs.
+    "9": frozenset({"tpr", "xtc_unwrapped", "bin"}),
+    # All "normal" bulk MSDs.
+    "9.1": frozenset({"tpr", "xtc_unwrapped"}),
+    # All spatially discretized MSDs.
+    "9.2": frozenset({"tpr", "xtc_unwrapped", "bin"}),
+    # All MSDs at coordination change.
+    "9.3": frozenset({"tpr", "xtc_unwrapped"}),
+    # All lifetime autocorrelations.
+    "10": frozenset({"tpr", "xtc_wrapped"}),
+    # All renewal event analyses.
+    "11": frozenset({"tpr", "xtc_unwrapped", "dtrj_discrete_z"}),
+    # All scripts extracting renewal events.
+    "11.1": frozenset({"tpr", "xtc_unwrapped"}),
+    # All renewal event lifetimes.
+    "11.2": frozenset(
+        {"dtrj_discrete_z", "dtrj_renewal_ether", "dtrj_renewal_tfsi"}
+    ),
+}
+SLAB_SCRIPTS = frozenset(
+    {
+        # Scripts that analyze a slab in xy plane.
+        "axial_hex_dist_1nn_Li",
+        "axial_hex_dist_1nn_NBT",
+        "axial_hex_dist_1nn_OBT",
+        "axial_hex_dist_1nn_OE",
+        "axial_hex_dist_2nn_Li",
+        "axial_hex_dist_2nn_NBT",
+        "axial_hex_dist_2nn_OBT",
+        "axial_hex_dist_2nn_OE",
+        "contact_hist_slab-z_Li-OBT",
+        "contact_hist_slab-z_Li-OE",
+        "discrete-hex_Li",
+        "discrete-hex_NBT",
+        "discrete-hex_OBT",
+        "discrete-hex_OE",
+    }
+)
+SLAB_NUMBER_OPTIONS = frozenset(
+    {
+        # Number options for the --scripts argument that contain
+        # scripts that analyze a slab in xy plane.
+        "0",  # All scripts.
+        "2",  # All slab scripts.
+        "4",  # All discrete-hex.
+        "5",  # All axial_hex_dist.
+        "6",  # All contact_hist.
+        "6.2",  # All contact_hist_slab-z.
+    }
 )
 
 
-def _assemble_submit_cmd(sbatch_opts, job_script):
-    """
+def _assemble_submit_cmd(sbatch_opts, job_script, parsable=False):
+    r"""
     Assemble a |Slurm| submit command.
 
     Parameters
@@ -393,114 +525,37 @@ def _assemble_submit_cmd(sbatch_opts, job_script):
         Dictionary containing options to parse to |sbatch|.
     job_script : str
         The job script to submit.
+    parsable : bool, optional
+        If ``True``, add the \--parsable option to the submit command so
+        that |sbatch| only prints the job ID (and the cluster name, if
+        any).
 
     Returns
     -------
-    submit_cmd : str
-        The submit command as one string.
+    submit_cmd : list
+        The submit command as list of arguments that can be directly
+        parsed to :func:`slurm.submit` or :func:`slurm.submit_parsable`.
 
     Notes
     -----
     This function relies on global variables!
     """
-    sbatch = "sbatch "
-    sbatch += opthandler.optdict2str(
-        sbatch_opts, skiped_opts=("None", "False"), dumped_vals=("True",)
+    return slurm.job_cmd(
+        sbatch_opts,
+        JOB_SCRIPTS[job_script],
+        posargs[job_script],
+        gmx_infile_pattern + "_" + job_script,
+        parsable=parsable,
     )
-    submit = sbatch
-    if "job-name" not in sbatch_opts and "J" not in sbatch_opts:
-        sbatch_jobname = " --job-name " + gmx_infile_pattern + "_"
-        submit += sbatch_jobname + job_script
-    if "output" not in sbatch_opts and "o" not in sbatch_opts:
-        sbatch_output = " --output " + gmx_infile_pattern + "_"
-        submit += sbatch_output + job_script + "_slurm-%j.out"
-    submit += " " + job_script + ".sh " + posargs[job_script]
-    return submit
-
-
-def _submit_discretized(sbatch_opts, job_script, bins):
-    r"""
-    Submit a |Slurm| job script for each bin in `bins`.
-
-    This function implements the \--discretize option of this submit
-    script.
-
-    Parameters
-    ----------
-    sbatch_opts : dict
-        Dictionary containing options to parse to |sbatch|.
-    job_script : str
-        The job script which should be submitted for each bin in `bins`.
-        The job script must analyze a slab in xy plane.
-    bins : list or tuple
-        List containing the bin edges.
-
-    Returns
-    -------
-    n_jobs_submitted : int
-        The number of submitted jobs.
-
-    Notes
-    -----
-    This function relies on global variables!
-    """
-    posargs = {
-        "axial_hex_dist_1nn_Li": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_1nn_NBT": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_1nn_OBT": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_1nn_OE": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_2nn_Li": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_2nn_NBT": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_2nn_OBT": posargs_general + posargs_trj[:3],
-        "axial_hex_dist_2nn_OE": posargs_general + posargs_trj[:3],
-        "contact_hist_slab-z_Li-OBT": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_slab-z_Li-OE": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "discrete-hex_Li": posargs_general + posargs_trj,
-        "discrete-hex_NBT": posargs_general + posargs_trj,
-        "discrete-hex_OBT": posargs_general + posargs_trj,
-        "discrete-hex_OE": posargs_general + posargs_trj,
-    }
-    if job_script not in posargs.keys():
-        raise ValueError(
-            "Invalid job script: '{}'.  The script does not analyze a slab in"
-            " xy plane".format(job_script)
-        )
-
-    sbatch = "sbatch "
-    sbatch += opthandler.optdict2str(
-        sbatch_opts, skiped_opts=("None", "False"), dumped_vals=("True",)
-    )
-    submit = sbatch
-
-    n_jobs_submitted = 0
-    for i, zmax in enumerate(bins[1:], 1):
-        slab = [bins[i - 1], zmax]
-        slab_str = "_{:.{prec}f}-{:.{prec}f}A".format(
-            slab[0], slab[1], prec=ARG_PREC
-        )
-        if "job-name" not in sbatch_opts and "J" not in sbatch_opts:
-            sbatch_jobname = " --job-name " + gmx_infile_pattern + "_"
-            submit += sbatch_jobname + job_script + slab_str
-        if "output" not in sbatch_opts and "o" not in sbatch_opts:
-            sbatch_output = " --output " + gmx_infile_pattern + "_"
-            submit += sbatch_output + job_script + slab_str + "_slurm-%j.out"
-        posargs_tmp = opthandler.posargs2str(
-            posargs[job_script] + slab, prec=ARG_PREC
-        )
-        submit += " " + job_script + ".sh " + posargs_tmp
-        subproc.check_output(shlex.split(submit))
-        n_jobs_submitted += 1
-    return n_jobs_submitted
 
 
 def _submit(sbatch_opts, job_script):
-    """
+    r"""
     Submit job scripts to the |Slurm| Workload Manager.
 
+    If \--discretize is given and `job_script` analyzes a slab in xy
+    plane, `job_script` is submitted once for each bin.
+
     Parameters
     ----------
     sbatch_opts : dict
@@ -518,24 +573,26 @@ def _submit(sbatch_opts, job_script):
     This function relies on global variables!
     """
     n_jobs_submitted = 0
-    if "gra" not in args["system"] and (
-        "axial_hex_dist" in job_script or "discrete-hex" in job_script
-    ):
+    if "gra" not in args["system"] and job_script in ELECTRODE_SCRIPTS:
         print(
             "NOTE: '{}' will not be submitted because the system contains no"
             " electrodes".format(job_script)
         )
-    elif args["discretize"] and (
-        "axial_hex_dist" in job_script
-        or "contact_hist_slab-z" in job_script
-        or "discrete-hex" in job_script
-    ):
-        n_jobs_submitted += _submit_discretized(
-            sbatch_opts, job_script, bin_edges
+    elif args["discretize"] and job_script in SLAB_SCRIPTS:
+        # The last two positional arguments of all slab scripts are the
+        # lower and upper boundary of the slab.  They are replaced by
+        # the bin edges.
+        n_jobs_submitted += slurm.submit_discretized(
+            sbatch_opts,
+            JOB_SCRIPTS[job_script],
+            posargs[job_script][:-2],
+            gmx_infile_pattern + "_" + job_script,
+            bin_edges,
+            prec=ARG_PREC,
+            unit="A",
         )
     else:
-        submit = _assemble_submit_cmd(sbatch_opts, job_script)
-        subproc.check_output(shlex.split(submit))
+        slurm.submit(_assemble_submit_cmd(sbatch_opts, job_script))
         n_jobs_submitted += 1
     return n_jobs_submitted
 
@@ -809,6 +866,28 @@ if __name__ == "__main__":  # noqa: C901
         default="gmx",
         help="Path to the MDTools installation.  Default: %(default)s.",
     )
+    parser_submit = parser.add_argument_group(title="Submission Options")
+    parser_submit.add_argument(
+        "--submit-threads",
+        type=int,
+        required=False,
+        default=1,
+        help=(
+            "Maximum number of jobs that are submitted concurrently.  Values"
+            " greater than 1 submit independent jobs concurrently in an"
+            " undefined order.  Default: %(default)s."
+        ),
+    )
+    parser_submit.add_argument(
+        "--skip-input-check",
+        required=False,
+        default=False,
+        action="store_true",
+        help=(
+            "Do not check whether the input files required by the scripts"
+            " selected with --scripts exist."
+        ),
+    )
     opts = opthandler.get_opts(
         argparser=parser,
         secs_known=(
@@ -826,9 +905,13 @@ if __name__ == "__main__":  # noqa: C901
     )
     args = opts["submit"]
     args_sbatch = opts["sbatch"]
-    args_sbatch_no_dep = copy.deepcopy(args_sbatch)
+    scripts = frozenset(args["scripts"].split())
+    # Read-only, because the option dicts are shared by many jobs.
+    args_sbatch_no_dep = args_sbatch.copy()
     args_sbatch_no_dep.pop("dependency", None)
     args_sbatch_no_dep.pop("d", None)
+    args_sbatch = MappingProxyType(args_sbatch)
+    args_sbatch_no_dep = MappingProxyType(args_sbatch_no_dep)
 
     gmx_infile_pattern = args["settings"] + "_" + args["system"]
     gmx_outfile_pattern = args["settings"] + "_out_" + args["system"]
@@ -846,11 +929,43 @@ if __name__ == "__main__":  # noqa: C901
     BIN_FILE = gmx_infile_pattern + "_density-z_number_Li_binsA.txt"
 
     print("Processing parsed arguments...")
+    # Map the names of all job scripts (without file extension) in the
+    # directory of this submit script to their absolute paths.  The
+    # directory is listed only once and only when this script is run.
+    with os.scandir(FILE_ROOT) as entries:
+        JOB_SCRIPTS = {
+            os.path.splitext(entry.name)[0]: entry.path
+            for entry in entries
+            if entry.name.endswith(".sh") and entry.is_file()
+        }
+    # Reject invalid script selections before doing anything else.
+    scripts_invalid = scripts.difference(NUMBER_REQUIREMENTS, JOB_SCRIPTS)
+    if scripts_invalid:
+        raise ValueError(
+            "Invalid choice(s) for --scripts: {}".format(
+                ", ".join(sorted(scripts_invalid))
+            )
+        )
+    # Check all option values before reading any file.
+    if args["submit_threads"] < 1:
+        raise ValueError(
+            "--submit-threads ({}) must be greater than"
+            " zero".format(args["submit_threads"])
+        )
     if args["slabwidth"] <= 0:
         raise ValueError(
             "--slabwidth ({}) must be greater than"
             " zero".format(args["slabwidth"])
         )
+    if (
+        args["discretize"]
+        and scripts.isdisjoint(SLAB_SCRIPTS)
+        and scripts.isdisjoint(SLAB_NUMBER_OPTIONS)
+    ):
+        raise ValueError(
+            "--discretize can only be used in conjunction with scripts that"
+            " analyze a slab in xy plane."
+        )
     if args["center_slab"]:
         if not os.path.isfile(GRO_FILE):
             raise FileNotFoundError(
@@ -881,132 +996,67 @@ if __name__ == "__main__":  # noqa: C901
                     args["zmax"], args["zmin"], args["slabwidth"]
                 )
             )
-        if (
-            "slab-z" not in args["scripts"]
-            and "axial_hex_dist" not in args["scripts"]
-            and "discrete-hex" not in args["scripts"]
-            and "0" not in args["scripts"].split()  # All scripts.
-            and "2" not in args["scripts"].split()  # All slab scripts.
-            and "4" not in args["scripts"].split()  # All discrete-hex.
-            and "5" not in args["scripts"].split()  # All axial_hex_dist.
-            and "6" not in args["scripts"].split()  # All contact_hist.
-            and "6.2" not in args["scripts"].split()  # All contact_hist_slab-z
-        ):
-            raise ValueError(
-                "--discretize can only be used in conjunction with scripts"
-                " that analyze a slab in xy plane."
-            )
-        edge = args["zmin"]
-        bin_edges = [edge]
-        while edge < args["zmax"]:
-            edge += args["slabwidth"]
-            bin_edges.append(edge)
+        bin_edges = gmx.get_bin_edges(
+            args["zmin"], args["zmax"], args["slabwidth"]
+        )
 
-    print("Checking if input files exist...")
-    files = {}
-    for script in args["scripts"].split():
-        if script in REQUIRE_TPR:
-            files.setdefault("run input", TPR_FILE)
-        if script in REQUIRE_XTC_WRAPPED:
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        if script in REQUIRE_XTC_UNWRAPPED:
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-        if script in REQUIRE_DTRJ_DISCRETE_Z:
-            files.setdefault("discretized trajectory", DTRJ_DISCRETE_Z_FILE)
-        if script in REQUIRE_DTRJ_RENEWAL_ETHER:
-            files.setdefault("discretized trajectory", DTRJ_RENEWAL_ETHER_FILE)
-        if script in REQUIRE_DTRJ_RENEWAL_TFSI:
-            files.setdefault("discretized trajectory", DTRJ_RENEWAL_TFSI_FILE)
-        if script in REQUIRE_BIN_FILE:
-            files.setdefault("bin", BIN_FILE)
-        if script == "0" or script == "1":  # All (bulk) scripts.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-            files.setdefault("bin", BIN_FILE)
-        elif script == "2":  # All slab scripts.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "3":  # All discrete-z_Li*.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-            files.setdefault("bin", BIN_FILE)
-        elif script == "4":  # All hexagonal discretizations.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "5":  # All axial_hex_dist*.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "6":  # All contact histograms.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-            files.setdefault("bin", BIN_FILE)
-        elif script == "6.1":  # All "normal" bulk contact histograms.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "6.2":  # All slab-z contact histograms.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "6.3":  # All contact_hist_at_pos_change*.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-            files.setdefault("bin", BIN_FILE)
-        elif script == "7":  # All lig_change_at_pos_change*.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-            files.setdefault("bin", BIN_FILE)
-        elif script == "8":  # All topological maps.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "9":  # All MSDs.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-            files.setdefault("bin", BIN_FILE)
-        elif script == "9.1":  # All "normal" bulk MSDs.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-        elif script == "9.2":  # All spatially discretized MSDs.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-            files.setdefault("bin", BIN_FILE)
-        elif script == "9.3":  # All MSDs at coordination change.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-        elif script == "10":  # All lifetime autocorrelations.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault("wrapped compressed trajectory", XTC_FILE_WRAPPED)
-        elif script == "11":  # All renewal event analyses.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-            files.setdefault("discretized trajectory", DTRJ_DISCRETE_Z_FILE)
-        elif script == "11.1":  # All scripts extracting renewal events.
-            files.setdefault("run input", TPR_FILE)
-            files.setdefault(
-                "unwrapped compressed trajectory", XTC_FILE_UNWRAPPED
-            )
-        elif script == "11.2":  # All renewal event lifetimes.
-            files.setdefault("discretized trajectory", DTRJ_DISCRETE_Z_FILE)
-            files.setdefault("discretized trajectory", DTRJ_RENEWAL_ETHER_FILE)
-            files.setdefault("discretized trajectory", DTRJ_RENEWAL_TFSI_FILE)
-    for filetype, filename in files.items():
-        if not os.path.isfile(filename):
-            raise FileNotFoundError(
-                "No such file: '{}' ({} file)".format(filename, filetype)
-            )
+    if not args["skip_input_check"]:
+        print("Checking if input files exist...")
+        # (Key, file name, file type, single scripts requiring file).
+        input_files = (
+            ("tpr", TPR_FILE, "run input", REQUIRE_TPR),
+            (
+                "xtc_wrapped",
+                XTC_FILE_WRAPPED,
+                "wrapped compressed trajectory",
+                REQUIRE_XTC_WRAPPED,
+            ),
+            (
+                "xtc_unwrapped",
+                XTC_FILE_UNWRAPPED,
+                "unwrapped compressed trajectory",
+                REQUIRE_XTC_UNWRAPPED,
+            ),
+            (
+                "dtrj_discrete_z",
+                DTRJ_DISCRETE_Z_FILE,
+                "discretized trajectory",
+                REQUIRE_DTRJ_DISCRETE_Z,
+            ),
+            (
+                "dtrj_renewal_ether",
+                DTRJ_RENEWAL_ETHER_FILE,
+                "discretized trajectory",
+                REQUIRE_DTRJ_RENEWAL_ETHER,
+            ),
+            (
+                "dtrj_renewal_tfsi",
+                DTRJ_RENEWAL_TFSI_FILE,
+                "discretized trajectory",
+                REQUIRE_DTRJ_RENEWAL_TFSI,
+            ),
+            ("bin", BIN_FILE, "bin", REQUIRE_BIN_FILE),
+        )
+        required = set()
+        for script in scripts:
+            required.update(NUMBER_REQUIREMENTS.get(script, ()))
+        # All input files are expected in the current working
+        # directory.  List this directory only once instead of calling
+        # stat for each input file, which can be slow on network file
+        # systems.  Fall back to `os.path.isfile` for files that are
+        # not found this way (e.g. because the file name contains a
+        # directory).
+        with os.scandir() as entries:
+            files_present = {
+                entry.name for entry in entries if entry.is_file()
+            }
+        for key, filename, filetype, require in input_files:
+            if key not in required and require.isdisjoint(scripts):
+                continue
+            if filename not in files_present and not os.path.isfile(filename):
+                raise FileNotFoundError(
+                    "No such file: '{}' ({} file)".format(filename, filetype)
+                )
 
     print("Preparing positional arguments for the slurm job scripts...")
     py_lmod = os.path.abspath(
@@ -1024,279 +1074,294 @@ if __name__ == "__main__":  # noqa: C901
         raise FileNotFoundError("No such directory: '{}'.".format(mdt_path))
     if args["py_exe"] is not None:
         args["py_exe"] = os.path.expandvars(args["py_exe"])
-    posargs_general = [
-        BASH_DIR,
-        py_lmod,
-        args["py_exe"],
-        mdt_path,
-        args["system"],
-        args["settings"],
-    ]
-    posargs_trj = [
-        args["begin"],
-        args["end"],
-        args["every"],
-        args["nblocks"],
-        args["restart"],
-    ]
-    posargs_contact = [args["cutoff"]]
-    posargs_discrete = [
-        args["intermittency"],
-        args["lag_compare"],
-        args["min_block_size"],
-        args["max_gap_size"],
-    ]
-    posargs_atom = [args["atom_index"]]
-    posargs_slab = [args["zmin"], args["zmax"]]
+    posargs_general = opthandler.posargs2list(
+        [
+            BASH_DIR,
+            py_lmod,
+            args["py_exe"],
+            mdt_path,
+            args["system"],
+            args["settings"],
+        ],
+        prec=ARG_PREC,
+    )
+    posargs_trj = opthandler.posargs2list(
+        [
+            args["begin"],
+            args["end"],
+            args["every"],
+            args["nblocks"],
+            args["restart"],
+        ],
+        prec=ARG_PREC,
+    )
+    posargs_contact = opthandler.posargs2list([args["cutoff"]], prec=ARG_PREC)
+    posargs_discrete = opthandler.posargs2list(
+        [
+            args["intermittency"],
+            args["lag_compare"],
+            args["min_block_size"],
+            args["max_gap_size"],
+        ],
+        prec=ARG_PREC,
+    )
+    posargs_atom = opthandler.posargs2list([args["atom_index"]], prec=ARG_PREC)
+    posargs_slab = opthandler.posargs2list(
+        [args["zmin"], args["zmax"]], prec=ARG_PREC
+    )
+    # Build the positional arguments of the single job scripts from
+    # shared lists.  The lists are never modified in place, so the job
+    # scripts can share the same list objects.
+    pa_trj = posargs_general + posargs_trj
+    pa_trj_short = posargs_general + posargs_trj[:3]  # begin, end, every.
+    pa_trj_slab = pa_trj + posargs_slab
+    pa_trj_short_slab = pa_trj_short + posargs_slab
+    pa_nblocks = posargs_general + posargs_trj[3:]  # nblocks, restart.
+    pa_restart = posargs_general + posargs_trj[4:]  # restart.
+    pa_contact = pa_trj_short + posargs_contact
+    pa_contact_slab = pa_contact + posargs_slab
+    pa_contact_atom = pa_contact + posargs_atom
+    pa_contact_intermittency = pa_contact + posargs_discrete[:1]
+    pa_contact_lag_compare = pa_contact + posargs_discrete[1:2]
+    pa_contact_blocks = pa_contact + posargs_discrete[1:]
+    pa_trj_contact_intermittency = (
+        pa_trj + posargs_contact + posargs_discrete[:1]
+    )
     # Position arguments must be in the right order for each job script.
     posargs = {
-        "axial_hex_dist_1nn_Li": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_1nn_NBT": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_1nn_OBT": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_1nn_OE": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_2nn_Li": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_2nn_NBT": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_2nn_OBT": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "axial_hex_dist_2nn_OE": (
-            posargs_general + posargs_trj[:3] + posargs_slab
-        ),
-        "contact_hist_Li-O": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_Li-OBT": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_Li-OE": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_O-Li": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_OBT-Li": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_OE-Li": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_at_pos_change_Li-OBT": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_at_pos_change_Li-OE": (
-            posargs_general + posargs_trj[:3] + posargs_contact
-        ),
-        "contact_hist_slab-z_Li-OBT": (
-            posargs_general + posargs_trj[:3] + posargs_contact + posargs_slab
-        ),
-        "contact_hist_slab-z_Li-OE": (
-            posargs_general + posargs_trj[:3] + posargs_contact + posargs_slab
-        ),
+        "axial_hex_dist_1nn_Li": pa_trj_short_slab,
+        "axial_hex_dist_1nn_NBT": pa_trj_short_slab,
+        "axial_hex_dist_1nn_OBT": pa_trj_short_slab,
+        "axial_hex_dist_1nn_OE": pa_trj_short_slab,
+        "axial_hex_dist_2nn_Li": pa_trj_short_slab,
+        "axial_hex_dist_2nn_NBT": pa_trj_short_slab,
+        "axial_hex_dist_2nn_OBT": pa_trj_short_slab,
+        "axial_hex_dist_2nn_OE": pa_trj_short_slab,
+        "contact_hist_Li-O": pa_contact,
+        "contact_hist_Li-OBT": pa_contact,
+        "contact_hist_Li-OE": pa_contact,
+        "contact_hist_O-Li": pa_contact,
+        "contact_hist_OBT-Li": pa_contact,
+        "contact_hist_OE-Li": pa_contact,
+        "contact_hist_at_pos_change_Li-OBT": pa_contact,
+        "contact_hist_at_pos_change_Li-OE": pa_contact,
+        "contact_hist_slab-z_Li-OBT": pa_contact_slab,
+        "contact_hist_slab-z_Li-OE": pa_contact_slab,
         "create_mda_universe": posargs_general[:3] + posargs_general[4:],
-        "discrete-hex_Li": posargs_general + posargs_trj + posargs_slab,
-        "discrete-hex_NBT": posargs_general + posargs_trj + posargs_slab,
-        "discrete-hex_OBT": posargs_general + posargs_trj + posargs_slab,
-        "discrete-hex_OE": posargs_general + posargs_trj + posargs_slab,
-        "discrete-z_Li": posargs_general + posargs_trj[:3],
-        "discrete-z_Li_state_lifetime_discrete": (
-            posargs_general + [posargs_trj[4]]
-        ),
-        "lifetime_autocorr_Li-ether": (
-            posargs_general
-            + posargs_trj
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "lifetime_autocorr_Li-NTf2": (
-            posargs_general
-            + posargs_trj
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "lifetime_autocorr_Li-OBT": (
-            posargs_general
-            + posargs_trj
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "lifetime_autocorr_Li-OE": (
-            posargs_general
-            + posargs_trj
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "lig_change_at_pos_change_Li-OBT": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + [posargs_discrete[1]]
-        ),
-        "lig_change_at_pos_change_Li-OE": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + [posargs_discrete[1]]
-        ),
-        "lig_change_at_pos_change_blocks_Li-OBT": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + posargs_discrete[1:]
-        ),
-        "lig_change_at_pos_change_blocks_Li-OE": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + posargs_discrete[1:]
-        ),
-        "lig_change_at_pos_change_blocks_hist_Li-OBT": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + posargs_discrete[1:]
-        ),
-        "lig_change_at_pos_change_blocks_hist_Li-OE": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + posargs_discrete[1:]
-        ),
-        "msd_ether": posargs_general + posargs_trj,
-        "msd_Li": posargs_general + posargs_trj,
-        "msd_NBT": posargs_general + posargs_trj,
-        "msd_NTf2": posargs_general + posargs_trj,
-        "msd_OBT": posargs_general + posargs_trj,
-        "msd_OE": posargs_general + posargs_trj,
-        "msd_layer_ether": posargs_general + posargs_trj,
-        "msd_layer_Li": posargs_general + posargs_trj,
-        "msd_layer_NBT": posargs_general + posargs_trj,
-        "msd_layer_NTf2": posargs_general + posargs_trj,
-        "msd_layer_OBT": posargs_general + posargs_trj,
-        "msd_layer_OE": posargs_general + posargs_trj,
-        "msd_at_coord_change_Li-ether": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "msd_at_coord_change_Li-NTf2": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "renewal_events_Li-ether": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "renewal_events_Li-ether_state_lifetime": (
-            posargs_general + posargs_trj[3:]
-        ),
-        "renewal_events_Li-ether_state_lifetime_discrete": (
-            posargs_general + [posargs_trj[4]]
-        ),
-        "renewal_events_Li-NTf2": (
-            posargs_general
-            + posargs_trj[:3]
-            + posargs_contact
-            + [posargs_discrete[0]]
-        ),
-        "renewal_events_Li-NTf2_state_lifetime": (
-            posargs_general + posargs_trj[3:]
-        ),
-        "renewal_events_Li-NTf2_state_lifetime_discrete": (
-            posargs_general + [posargs_trj[4]]
-        ),
-        "topo_map_Li-OBT": (
-            posargs_general + posargs_trj[:3] + posargs_contact + posargs_atom
-        ),
-        "topo_map_Li-OE": (
-            posargs_general + posargs_trj[:3] + posargs_contact + posargs_atom
-        ),
-    }
-    posargs = {
-        k: opthandler.posargs2str(v, prec=ARG_PREC) for k, v in posargs.items()
+        "discrete-hex_Li": pa_trj_slab,
+        "discrete-hex_NBT": pa_trj_slab,
+        "discrete-hex_OBT": pa_trj_slab,
+        "discrete-hex_OE": pa_trj_slab,
+        "discrete-z_Li": pa_trj_short,
+        "discrete-z_Li_state_lifetime_discrete": pa_restart,
+        "lifetime_autocorr_Li-ether": pa_trj_contact_intermittency,
+        "lifetime_autocorr_Li-NTf2": pa_trj_contact_intermittency,
+        "lifetime_autocorr_Li-OBT": pa_trj_contact_intermittency,
+        "lifetime_autocorr_Li-OE": pa_trj_contact_intermittency,
+        "lig_change_at_pos_change_Li-OBT": pa_contact_lag_compare,
+        "lig_change_at_pos_change_Li-OE": pa_contact_lag_compare,
+        "lig_change_at_pos_change_blocks_Li-OBT": pa_contact_blocks,
+        "lig_change_at_pos_change_blocks_Li-OE": pa_contact_blocks,
+        "lig_change_at_pos_change_blocks_hist_Li-OBT": pa_contact_blocks,
+        "lig_change_at_pos_change_blocks_hist_Li-OE": pa_contact_blocks,
+        "msd_ether": pa_trj,
+        "msd_Li": pa_trj,
+        "msd_NBT": pa_trj,
+        "msd_NTf2": pa_trj,
+        "msd_OBT": pa_trj,
+        "msd_OE": pa_trj,
+        "msd_layer_ether": pa_trj,
+        "msd_layer_Li": pa_trj,
+        "msd_layer_NBT": pa_trj,
+        "msd_layer_NTf2": pa_trj,
+        "msd_layer_OBT": pa_trj,
+        "msd_layer_OE": pa_trj,
+        "msd_at_coord_change_Li-ether": pa_contact_intermittency,
+        "msd_at_coord_change_Li-NTf2": pa_contact_intermittency,
+        "renewal_events_Li-ether": pa_contact_intermittency,
+        "renewal_events_Li-ether_state_lifetime": pa_nblocks,
+        "renewal_events_Li-ether_state_lifetime_discrete": pa_restart,
+        "renewal_events_Li-NTf2": pa_contact_intermittency,
+        "renewal_events_Li-NTf2_state_lifetime": pa_nblocks,
+        "renewal_events_Li-NTf2_state_lifetime_discrete": pa_restart,
+        "topo_map_Li-OBT": pa_contact_atom,
+        "topo_map_Li-OE": pa_contact_atom,
     }
+    # Names of all job scripts in a fixed order.
+    batch_scripts = tuple(posargs)
+    for batch_script in batch_scripts:
+        if batch_script not in JOB_SCRIPTS:
+            raise FileNotFoundError(
+                "No such file: '{}'.  This might happen if you change the"
+                " directory structure of this project".format(
+                    os.path.join(FILE_ROOT, batch_script + ".sh")
+                )
+            )
 
     print("Submitting job(s) to Slurm...")
     n_scripts_submitted = 0
+    # Jobs that other jobs depend on are submitted immediately, because
+    # their job IDs are required for the submission of the dependent
+    # jobs.  All other jobs are only collected as (sbatch options, job
+    # script) pairs and submitted together at the end (concurrently if
+    # --submit-threads is greater than 1).
+    jobs = []
     # Submit single scripts by name.
-    for batch_script in posargs.keys():
-        if batch_script in args["scripts"].split():
-            n_scripts_submitted += _submit(args_sbatch, batch_script)
+    for batch_script in batch_scripts:
+        if batch_script in scripts:
+            jobs.append((args_sbatch, batch_script))
+    # Scripts belonging to the script selections.  The selections that
+    # consist of independent scripts are submitted at the end.
+    selections = {
+        # All slab scripts.
+        "2": [bs for bs in batch_scripts if bs in SLAB_SCRIPTS],
+        # All hexagonal discretizations.
+        "4": [bs for bs in batch_scripts if bs.startswith("discrete-hex")],
+        # All axial_hex_dist*.
+        "5": [bs for bs in batch_scripts if bs.startswith("axial_hex_dist")],
+        # All contact histograms.
+        "6": [bs for bs in batch_scripts if bs.startswith("contact_hist")],
+        # All "normal" bulk contact histograms.
+        "6.1": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("contact_hist")
+            and not bs.startswith("contact_hist_at_pos_change")
+            and not bs.startswith("contact_hist_slab-z")
+        ],
+        # All slab-z contact histograms.
+        "6.2": [
+            bs for bs in batch_scripts if bs.startswith("contact_hist_slab-z")
+        ],
+        # All contact_hist_at_pos_change*.
+        "6.3": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("contact_hist_at_pos_change")
+        ],
+        # All lig_change_at_pos_change*.
+        "7": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("lig_change_at_pos_change")
+        ],
+        # All topological maps.
+        "8": [bs for bs in batch_scripts if bs.startswith("topo_map")],
+        # All MSDs.
+        "9": [bs for bs in batch_scripts if bs.startswith("msd")],
+        # All "normal" bulk MSDs.
+        "9.1": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("msd")
+            and not bs.startswith("msd_at_coord_change")
+            and not bs.startswith("msd_layer")
+        ],
+        # All spatially discretized MSDs.
+        "9.2": [bs for bs in batch_scripts if bs.startswith("msd_layer")],
+        # All MSDs at coordination change.
+        "9.3": [
+            bs for bs in batch_scripts if bs.startswith("msd_at_coord_change")
+        ],
+        # All lifetime autocorrelations.
+        "10": [
+            bs for bs in batch_scripts if bs.startswith("lifetime_autocorr")
+        ],
+        # All scripts extracting renewal events.
+        "11.1": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("renewal_events") and "state_lifetime" not in bs
+        ],
+        # All renewal event lifetimes.
+        "11.2": [
+            bs
+            for bs in batch_scripts
+            if bs.startswith("renewal_events") and "state_lifetime" in bs
+        ],
+    }
     # Submit multiple scripts by number.
-    if "0" in args["scripts"].split() or "1" in args["scripts"].split():
+    if "0" in scripts or "1" in scripts:
         # All scripts (0) or All bulk scripts (1).
         # create_mda_universe
-        submit = _assemble_submit_cmd(args_sbatch, "create_mda_universe")
-        job_id_mda_universe = subproc.check_output(shlex.split(submit))
-        job_id_mda_universe = strng.extract_ints_from_str(job_id_mda_universe)
-        job_id_mda_universe = job_id_mda_universe[0]
-        args_sbatch_dep_mda_universe = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_mda_universe["dependency"] = "afterok:{}".format(
-            job_id_mda_universe
+        job_id_mda_universe = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch, "create_mda_universe", parsable=True
+            )
+        )
+        args_sbatch_dep_mda_universe = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_mda_universe),
+            }
         )
         n_scripts_submitted += 1
         # discrete-z_Li
-        submit = _assemble_submit_cmd(
-            args_sbatch_dep_mda_universe, "discrete-z_Li"
-        )
-        job_id_discrete_z_li = subproc.check_output(shlex.split(submit))
-        job_id_discrete_z_li = strng.extract_ints_from_str(
-            job_id_discrete_z_li
+        job_id_discrete_z_li = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch_dep_mda_universe, "discrete-z_Li", parsable=True
+            )
         )
-        job_id_discrete_z_li = job_id_discrete_z_li[0]
-        args_sbatch_dep_discrete_z_li = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_discrete_z_li["dependency"] = "afterok:{}".format(
-            job_id_discrete_z_li
+        args_sbatch_dep_discrete_z_li = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_discrete_z_li),
+            }
         )
         n_scripts_submitted += 1
         # renewal_events_Li-ether
-        submit = _assemble_submit_cmd(
-            args_sbatch_dep_discrete_z_li, "renewal_events_Li-ether"
-        )
-        job_id_renewal_ether = subproc.check_output(shlex.split(submit))
-        job_id_renewal_ether = strng.extract_ints_from_str(
-            job_id_renewal_ether
+        job_id_renewal_ether = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch_dep_discrete_z_li,
+                "renewal_events_Li-ether",
+                parsable=True,
+            )
         )
-        job_id_renewal_ether = job_id_renewal_ether[0]
-        args_sbatch_dep_renewal_ether = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_renewal_ether["dependency"] = "afterok:{}".format(
-            job_id_renewal_ether
+        args_sbatch_dep_renewal_ether = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_renewal_ether),
+            }
         )
         n_scripts_submitted += 1
         # renewal_events_Li-NTf2
-        submit = _assemble_submit_cmd(
-            args_sbatch_dep_discrete_z_li, "renewal_events_Li-NTf2"
+        job_id_renewal_tfsi = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch_dep_discrete_z_li,
+                "renewal_events_Li-NTf2",
+                parsable=True,
+            )
         )
-        job_id_renewal_tfsi = subproc.check_output(shlex.split(submit))
-        job_id_renewal_tfsi = strng.extract_ints_from_str(job_id_renewal_tfsi)
-        job_id_renewal_tfsi = job_id_renewal_tfsi[0]
-        args_sbatch_dep_renewal_tfsi = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_renewal_tfsi["dependency"] = "afterok:{}".format(
-            job_id_renewal_tfsi
+        args_sbatch_dep_renewal_tfsi = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_renewal_tfsi),
+            }
         )
         n_scripts_submitted += 1
-        for batch_script in posargs.keys():
-            if "0" not in args["scripts"].split() and (
-                "axial_hex_dist" in batch_script
-                or "contact_hist_slab-z" in batch_script
-                or "discrete-hex" in batch_script
-                or "msd_layer" in batch_script
+        # Map each job script to the sbatch options that contain the
+        # dependency on the job that creates its input.  The REQUIRE_*
+        # sets might overlap, so the order of the updates matters: The
+        # renewal-event trajectories take precedence over the
+        # discretized trajectory.  All other scripts only depend on the
+        # MDAnalysis universe.
+        sbatch_opts_dep = dict.fromkeys(
+            REQUIRE_DTRJ_DISCRETE_Z, args_sbatch_dep_discrete_z_li
+        )
+        sbatch_opts_dep.update(
+            dict.fromkeys(
+                REQUIRE_DTRJ_RENEWAL_TFSI, args_sbatch_dep_renewal_tfsi
+            )
+        )
+        sbatch_opts_dep.update(
+            dict.fromkeys(
+                REQUIRE_DTRJ_RENEWAL_ETHER, args_sbatch_dep_renewal_ether
+            )
+        )
+        for batch_script in batch_scripts:
+            if "0" not in scripts and (
+                batch_script in SLAB_SCRIPTS
+                or batch_script.startswith("msd_layer")
             ):
                 # Only bulk scripts.
                 # msd_layer_serial.py (and msd_layer_parallel.py) must
@@ -1310,171 +1375,75 @@ if __name__ == "__main__":  # noqa: C901
                 "renewal_events_Li-NTf2",
             ):
                 continue
-            if "lig_change_at_pos_change" in batch_script:
+            if batch_script.startswith("lig_change_at_pos_change"):
                 # Exclude all lig_change_at_pos_change* scripts.
                 continue
-            elif batch_script in REQUIRE_DTRJ_RENEWAL_ETHER:
-                sbatch_opts = args_sbatch_dep_renewal_ether
-            elif batch_script in REQUIRE_DTRJ_RENEWAL_TFSI:
-                sbatch_opts = args_sbatch_dep_renewal_tfsi
-            elif batch_script in REQUIRE_DTRJ_DISCRETE_Z:
-                sbatch_opts = args_sbatch_dep_discrete_z_li
-            else:
-                sbatch_opts = args_sbatch_dep_mda_universe
-            n_scripts_submitted += _submit(sbatch_opts, batch_script)
-    if "2" in args["scripts"].split():
-        # All slab scripts.
-        for batch_script in posargs.keys():
-            if (
-                "axial_hex_dist" in batch_script
-                or "contact_hist_slab-z" in batch_script
-                or "discrete-hex" in batch_script
-            ):
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "3" in args["scripts"].split():
+            sbatch_opts = sbatch_opts_dep.get(
+                batch_script, args_sbatch_dep_mda_universe
+            )
+            jobs.append((sbatch_opts, batch_script))
+    if "3" in scripts:
         # All discrete-z_Li*.
         # discrete-z_Li
-        submit = _assemble_submit_cmd(args_sbatch, "discrete-z_Li")
-        job_id = subproc.check_output(shlex.split(submit))
-        job_id = strng.extract_ints_from_str(job_id)[0]
-        args_sbatch_dep = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep["dependency"] = "afterok:{}".format(job_id)
-        n_scripts_submitted += 1
-        # discrete-z_Li_state_lifetime_discrete
-        submit = _assemble_submit_cmd(
-            args_sbatch_dep, "discrete-z_Li_state_lifetime_discrete"
+        job_id = slurm.submit_parsable(
+            _assemble_submit_cmd(args_sbatch, "discrete-z_Li", parsable=True)
+        )
+        args_sbatch_dep = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id),
+            }
         )
-        subproc.check_output(shlex.split(submit))
         n_scripts_submitted += 1
-    if "4" in args["scripts"].split():
-        # All hexagonal discretizations.
-        for batch_script in posargs.keys():
-            if "discrete-hex" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "5" in args["scripts"].split():
-        # All axial_hex_dist*.
-        for batch_script in posargs.keys():
-            if "axial_hex_dist" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "6" in args["scripts"].split():
-        # All contact histograms.
-        for batch_script in posargs.keys():
-            if "contact_hist" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "6.1" in args["scripts"].split():
-        # All "normal" bulk contact histograms.
-        for batch_script in posargs.keys():
-            if (
-                "contact_hist" in batch_script
-                and "contact_hist_at_pos_change" not in batch_script
-                and "contact_hist_slab-z" not in batch_script
-            ):
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "6.2" in args["scripts"].split():
-        # All slab-z contact histograms.
-        for batch_script in posargs.keys():
-            if "contact_hist_slab-z" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "6.3" in args["scripts"].split():
-        # All contact_hist_at_pos_change*.
-        for batch_script in posargs.keys():
-            if "contact_hist_at_pos_change" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "7" in args["scripts"].split():
-        # All lig_change_at_pos_change*.
-        for batch_script in posargs.keys():
-            if "lig_change_at_pos_change" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "8" in args["scripts"].split():
-        # All topological maps.
-        for batch_script in posargs.keys():
-            if "topo_map" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "9" in args["scripts"].split():
-        # All MSDs.
-        for batch_script in posargs.keys():
-            if "msd" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "9.1" in args["scripts"].split():
-        # All "normal" bulk MSDs.
-        for batch_script in posargs.keys():
-            if (
-                "msd" in batch_script
-                and "msd_at_coord_change" not in batch_script
-                and "msd_layer" not in batch_script
-            ):
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "9.2" in args["scripts"].split():
-        # All spatially discretized MSDs.
-        for batch_script in posargs.keys():
-            if "msd_layer" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "9.3" in args["scripts"].split():
-        # All MSDs at coordination change.
-        for batch_script in posargs.keys():
-            if "msd_at_coord_change" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "10" in args["scripts"].split():
-        # All lifetime autocorrelations.
-        for batch_script in posargs.keys():
-            if "lifetime_autocorr" in batch_script:
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "11" in args["scripts"].split():
+        # discrete-z_Li_state_lifetime_discrete
+        jobs.append((args_sbatch_dep, "discrete-z_Li_state_lifetime_discrete"))
+    if "11" in scripts:
         # All renewal event analyses.
         # renewal_events_Li-ether
-        submit = _assemble_submit_cmd(args_sbatch, "renewal_events_Li-ether")
-        job_id_renewal_ether = subproc.check_output(shlex.split(submit))
-        job_id_renewal_ether = strng.extract_ints_from_str(
-            job_id_renewal_ether
+        job_id_renewal_ether = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch, "renewal_events_Li-ether", parsable=True
+            )
         )
-        job_id_renewal_ether = job_id_renewal_ether[0]
-        args_sbatch_dep_renewal_ether = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_renewal_ether["dependency"] = "afterok:{}".format(
-            job_id_renewal_ether
+        args_sbatch_dep_renewal_ether = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_renewal_ether),
+            }
         )
         n_scripts_submitted += 1
         # renewal_events_Li-NTf2
-        submit = _assemble_submit_cmd(args_sbatch, "renewal_events_Li-NTf2")
-        job_id_renewal_tfsi = subproc.check_output(shlex.split(submit))
-        job_id_renewal_tfsi = strng.extract_ints_from_str(job_id_renewal_tfsi)
-        job_id_renewal_tfsi = job_id_renewal_tfsi[0]
-        args_sbatch_dep_renewal_tfsi = copy.deepcopy(args_sbatch_no_dep)
-        args_sbatch_dep_renewal_tfsi["dependency"] = "afterok:{}".format(
-            job_id_renewal_tfsi
+        job_id_renewal_tfsi = slurm.submit_parsable(
+            _assemble_submit_cmd(
+                args_sbatch, "renewal_events_Li-NTf2", parsable=True
+            )
+        )
+        args_sbatch_dep_renewal_tfsi = MappingProxyType(
+            {
+                **args_sbatch_no_dep,
+                "dependency": "afterok:{}".format(job_id_renewal_tfsi),
+            }
         )
         n_scripts_submitted += 1
-        for batch_script in posargs.keys():
-            if (
-                "renewal_events" in batch_script
-                and "state_lifetime" in batch_script
-            ):
-                if batch_script in REQUIRE_DTRJ_RENEWAL_ETHER:
-                    sbatch_opts = args_sbatch_dep_renewal_ether
-                elif batch_script in REQUIRE_DTRJ_RENEWAL_TFSI:
-                    sbatch_opts = args_sbatch_dep_renewal_tfsi
-                else:
-                    raise LookupError(
-                        "'{}' is neither in REQUIRE_DTRJ_RENEWAL_ETHER nor in"
-                        " REQUIRE_DTRJ_RENEWAL_TFSI.  This should not have"
-                        " happened".format(batch_script)
-                    )
-                n_scripts_submitted += _submit(sbatch_opts, batch_script)
-    if "11.1" in args["scripts"].split():
-        # All scripts extracting renewal events.
-        for batch_script in posargs.keys():
-            if (
-                "renewal_events" in batch_script
-                and "state_lifetime" not in batch_script
-            ):
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
-    if "11.2" in args["scripts"].split():
         # All renewal event lifetimes.
-        for batch_script in posargs.keys():
-            if (
-                "renewal_events" in batch_script
-                and "state_lifetime" in batch_script
-            ):
-                n_scripts_submitted += _submit(args_sbatch, batch_script)
+        for batch_script in selections["11.2"]:
+            if batch_script in REQUIRE_DTRJ_RENEWAL_ETHER:
+                sbatch_opts = args_sbatch_dep_renewal_ether
+            elif batch_script in REQUIRE_DTRJ_RENEWAL_TFSI:
+                sbatch_opts = args_sbatch_dep_renewal_tfsi
+            else:
+                raise LookupError(
+                    "'{}' is neither in REQUIRE_DTRJ_RENEWAL_ETHER nor in"
+                    " REQUIRE_DTRJ_RENEWAL_TFSI.  This should not have"
+                    " happened".format(batch_script)
+                )
+            jobs.append((sbatch_opts, batch_script))
+    for selector, selection in selections.items():
+        if selector in scripts:
+            jobs.extend((args_sbatch, bs) for bs in selection)
+    n_scripts_submitted += slurm.submit_jobs(
+        _submit, jobs, max_workers=args["submit_threads"]
+    )
     print("Submitted {} jobs".format(n_scripts_submitted))
     if n_scripts_submitted == 0:
         warnings.warn("No script submitted", UserWarning)
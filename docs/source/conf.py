@@ -34,14 +34,20 @@ import tomlkit
 
 # Recursively import all directories containing Pyhon scripts.
 directories = ("analysis", "python", "simulation")
+paths = []
 for directory in directories:
     for path in os.walk(os.path.abspath("../../" + directory)):
-        sys.path.insert(1, path[0])
+        paths.append(path[0])
+# Insert all paths at once instead of shifting sys.path for every
+# single path.  Reverse them to keep the order that inserting them one
+# by one at index 1 used to produce.
+sys.path[1:1] = reversed(paths)
 
 
 # -- Project information -----------------------------------------------
 
-metadata = tomlkit.load(open("../../pyproject.toml", "r"))
+with open("../../pyproject.toml", "r") as file:
+    metadata = tomlkit.load(file)
 
 # The documented project's name.
 project = str(metadata["project"]["name"])
@@ -8,6 +8,71 @@ performed with |Gromacs|.
 """
 
 
+# Standard libraries
+import io
+import math
+import re
+
+
+# Lines of an .mdp file that start with "nsteps" (ignoring leading
+# whitespace but not newline characters).
+_NSTEPS_LINE_REGEX = re.compile(r"^[^\S\n]*nsteps.*$", re.MULTILINE)
+
+
+def get_bin_edges(start, stop, binwidth):
+    """
+    Get the edges of bins of equal width.
+
+    Divide the interval from `start` to `stop` in bins of the given bin
+    width.  If the interval length is not an integer multiple of the bin
+    width, the last bin extends beyond `stop`.
+
+    Parameters
+    ----------
+    start : float
+        The first bin edge.
+    stop : float
+        The value up to which the bins must reach.
+    binwidth : float
+        The width of the bins.
+
+    Returns
+    -------
+    bin_edges : list
+        The bin edges.  The number of bins is ``len(bin_edges) - 1``.
+
+    Notes
+    -----
+    The edges are computed directly from their index instead of
+    accumulating the bin width to avoid the propagation of floating
+    point errors.  The number of bins is rounded to six decimal places
+    before taking the ceiling, so that floating point noise does not
+    create an additional bin.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from gmx import get_bin_edges
+
+    >>> get_bin_edges(0, 1, 0.25)
+    [0.0, 0.25, 0.5, 0.75, 1.0]
+    >>> get_bin_edges(0, 1, 0.375)
+    [0.0, 0.375, 0.75, 1.125]
+
+    (1.0 - 0.7) / 0.1 is 3.0000000000000004 in floating point
+    arithmetic, which must still result in three bins.
+
+    >>> bin_edges = get_bin_edges(0.7, 1.0, 0.1)
+    >>> len(bin_edges) - 1
+    3
+    >>> [round(edge, 6) for edge in bin_edges]
+    [0.7, 0.8, 0.9, 1.0]
+    """
+    n_bins = math.ceil(round((stop - start) / binwidth, 6))
+    return [start + i * binwidth for i in range(n_bins + 1)]
+
+
 def get_box_from_gro(fname):
     """
     Extract the simulation box dimensions from a |gro_file|.
@@ -41,15 +106,36 @@ def get_last_time_from_log(fname):
     Returns
     -------
     time : float
-        The time of the last frame in the |log_file|.
+        The time of the last frame in the |log_file|.  ``None`` if the
+        |log_file| does not contain any frame.
+
+    Notes
+    -----
+    The |log_file| is read backwards in blocks of increasing size
+    (starting with 64 KiB) until the last frame is found.  Thus, only
+    the end of the |log_file| is read, regardless of the total file
+    size.
     """  # noqa: W505,E501
-    lines = tail(fname, 300)
-    line_prev = ""
-    for line in lines[::-1]:
-        if "Step" in line and "Time" in line:
-            step, time = line_prev.split()
-            return float(time)
-        line_prev = line
+    blocksize = 65536
+    with open(fname, "rb") as file:
+        file.seek(0, 2)  # Set cursor to end of file.
+        end = file.tell()  # Get current cursor position.
+        while True:
+            pos = max(end - blocksize, 0)
+            file.seek(pos, 0)  # Move cursor backwards.
+            lines = file.read(end - pos).splitlines()
+            if pos > 0:
+                # The first line might be incomplete.
+                lines = lines[1:]
+            line_prev = b""
+            for line in reversed(lines):
+                if b"Step" in line and b"Time" in line:
+                    step, time = line_prev.split()
+                    return float(time)
+                line_prev = line
+            if pos == 0:  # Reached start of file.
+                return None
+            blocksize *= 4
 
 
 def get_nbins(fname, binwidth):
@@ -78,7 +164,7 @@ def get_nbins(fname, binwidth):
 
 
 def get_nsteps_from_mdp(fname):
-    """
+    r"""
     Extract the maximum number of simulation steps of an |Gromacs| MD
     simulation from the |mdp_file|.
 
@@ -99,28 +185,62 @@ def get_nsteps_from_mdp(fname):
     ValueError
         If the input file does not contain a line that starts with
         "nsteps" or if "nsteps" is not followed by an equal (=) sign.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from gmx import get_nsteps_from_mdp
+
+    >>> import os
+    >>> import tempfile
+    >>> tmpdir = tempfile.TemporaryDirectory()
+    >>> fname = os.path.join(tmpdir.name, 'md.mdp')
+
+    If nsteps is given multiple times, the last occurrence is used.
+    Lines that only contain "nsteps" somewhere in the middle are
+    ignored.
+
+    >>> mdp = (
+    ...     'integrator = md\n'
+    ...     'nsteps     = 1000  ; First occurrence\n'
+    ...     'dt         = 0.002\n'
+    ...     '; nsteps   = 3000\n'
+    ...     '  nsteps   = 2000  ; Last occurrence'
+    ... )
+    >>> with open(fname, 'w') as file:
+    ...     print(mdp, end='', file=file)
+    >>> get_nsteps_from_mdp(fname)
+    2000
+
+    Without trailing newline character, the last line is found as well.
+
+    >>> with open(fname, 'w') as file:
+    ...     print('dt = 0.002\nnsteps = 500', end='', file=file)
+    >>> get_nsteps_from_mdp(fname)
+    500
+    >>> tmpdir.cleanup()
     """  # noqa: W505,E501
     with open(fname, "r") as file:
-        found_nsteps = False
-        for i, line in enumerate(file):
-            line = line.strip()
-            if line.startswith("nsteps"):
-                found_nsteps = True
-                line_nsteps = line
-                line_num = i + 1
-                # nsteps can be defined multiple times in an .mdp file.
-                # From
-                # https://manual.gromacs.org/documentation/current/reference-manual/file-formats.html#mdp  # noqa: W505,E501
-                # "The ordering of the items is not important, but if
-                # you enter the same thing twice, the last is used."
-                # => Do not break the loop after the first occurence of
-                #    'nsteps'.
-    if not found_nsteps:
+        text = file.read()
+    # Search the whole file with a single regular expression instead of
+    # stripping and testing every line in Python.
+    # nsteps can be defined multiple times in an .mdp file.  From
+    # https://manual.gromacs.org/documentation/current/reference-manual/file-formats.html#mdp  # noqa: W505,E501
+    # "The ordering of the items is not important, but if you enter the
+    # same thing twice, the last is used."
+    # => Use the last occurrence of 'nsteps'.
+    match = None
+    for match in _NSTEPS_LINE_REGEX.finditer(text):
+        pass
+    if match is None:
         raise ValueError(
             "Could not fine a line in file '{}' that starts with"
             " 'nsteps'".format(fname)
         )
+    line_nsteps = match.group().strip()
     if "=" not in line_nsteps:
+        line_num = text.count("\n", 0, match.start()) + 1
         raise ValueError(
             "Line {} in file '{}' starts with 'nsteps' but does not contain an"
             " equal (=) sign".format(line_num, fname)
@@ -131,7 +251,7 @@ def get_nsteps_from_mdp(fname):
 
 
 def tail(fname, n):
-    """
+    r"""
     Read the last n lines from a file.
 
     Parameters
@@ -146,22 +266,70 @@ def tail(fname, n):
     lines : list
         List containing the last `n` lines of the input file.  Each list
         item represents one line of the file.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from gmx import tail
+
+    >>> import os
+    >>> import tempfile
+    >>> tmpdir = tempfile.TemporaryDirectory()
+    >>> fname = os.path.join(tmpdir.name, 'tail.txt')
+
+    The file is shorter than one block and the last line has no
+    trailing newline character.
+
+    >>> with open(fname, 'w') as file:
+    ...     print('line 1\nline 2\nline 3', end='', file=file)
+    >>> tail(fname, 2)
+    ['line 2\n', 'line 3']
+    >>> tail(fname, 5)
+    ['line 1\n', 'line 2\n', 'line 3']
+    >>> tail(fname, 0)
+    []
+
+    The file spans several blocks.
+
+    >>> with open(fname, 'w') as file:
+    ...     for i in range(5000):
+    ...         print('line', i, file=file)
+    >>> os.path.getsize(fname) > 8192
+    True
+    >>> tail(fname, 3)
+    ['line 4997\n', 'line 4998\n', 'line 4999\n']
+    >>> len(tail(fname, 2000))
+    2000
+    >>> tail(fname, 2000)[0]
+    'line 3000\n'
+    >>> tmpdir.cleanup()
     """
     lines = []
     if n <= 0:
         return lines
-    # Step width to move the cursor (emprical value giving best
-    # performance).
-    step_width = max(10 * n, 1)
-    with open(fname, "r") as file:
+    blocksize = 8192
+    with open(fname, "rb") as file:
         file.seek(0, 2)  # Set cursor to end of file.
         pos = file.tell()  # Get current cursor position.
-        # n+1 required to get the entire n-th line and not just its
-        # ending.
-        while len(lines) < n + 1:
-            pos -= min(step_width, pos)
+        # Read the file backwards in blocks and only count the newline
+        # characters of each new block instead of re-reading and
+        # decoding everything from the cursor to the end of the file.
+        # n+1 newline characters are required to get the entire n-th
+        # line and not just its ending.
+        blocks = []
+        n_newlines = 0
+        while n_newlines < n + 1 and pos > 0:
+            step = min(blocksize, pos)
+            pos -= step
             file.seek(pos, 0)  # Move cursor backwards.
-            lines = file.readlines()
-            if pos == 0:  # Reached start of file.
-                break
+            blocks.append(file.read(step))
+            n_newlines += blocks[-1].count(b"\n")
+    data = b"".join(reversed(blocks))
+    if pos > 0:
+        # The first line might be incomplete.
+        data = data[data.index(b"\n") + 1 :]
+    # Decode only the end of the file and split it into lines the same
+    # way as a file opened in text mode.
+    lines = io.TextIOWrapper(io.BytesIO(data)).readlines()
     return lines[-n:]
@@ -1022,6 +1022,56 @@ def optlist2dict(optlist, convert=False, **kwargs):
     return optdict
 
 
+def posargs2list(posargs, prec=3):
+    """
+    Convert a list of positional arguments to a list of strings.
+
+    Parameters
+    ----------
+    posargs : iterable
+        The list of positional arguments.
+    prec : int, optional
+        The number of decimal places to use for floating point numbers.
+
+    Returns
+    -------
+    posargs : list
+        The positional arguments as list of strings.
+
+    See Also
+    --------
+    :func:`posargs2str` :
+        Convert a list of positional arguments to a string
+
+    Notes
+    -----
+    This function is meant to generate a list of positional arguments
+    that can be appended to the argument list of a command that submits
+    the Slurm job scripts of this project (e.g. when calling
+    :func:`subprocess.run`).
+
+    ``True``/``False`` are converted to ``'1'``/``'0'``.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from opthandler import posargs2list
+
+    >>> posargs = ["in", "out", 0, 12.345, 12.344, True, "arg1 arg2"]
+    >>> posargs2list(posargs, prec=2)
+    ['in', 'out', '0', '12.35', '12.34', '1', 'arg1 arg2']
+    """
+    # Set a fixed number of decimal points for floats.
+    posargs = (
+        "{:.{p}f}".format(arg, p=prec) if isinstance(arg, float) else arg
+        for arg in posargs
+    )
+    # Convert `True` to 1 and `False` to 0.
+    posargs = (int(arg) if isinstance(arg, bool) else arg for arg in posargs)
+    return [str(arg) for arg in posargs]
+
+
 def posargs2str(posargs, prec=3):
     """
     Convert a list of positional arguments to a string.
@@ -1038,6 +1088,11 @@ def posargs2str(posargs, prec=3):
     posargs : str
         The positional arguments as string.
 
+    See Also
+    --------
+    :func:`posargs2list` :
+        Convert a list of positional arguments to a list of strings
+
     Notes
     -----
     This function is meant to generate a string of positional arguments
@@ -1045,6 +1100,9 @@ def posargs2str(posargs, prec=3):
 
     ``True``/``False`` are converted to ``'1'``/``'0'``.
 
+    This function simply applies :func:`shlex.join` on the output of
+    :func:`posargs2list`.
+
     Examples
     --------
     .. testsetup::
@@ -1055,14 +1113,7 @@ def posargs2str(posargs, prec=3):
     >>> posargs2str(posargs, prec=2)
     "in out 0 12.35 12.34 1 'arg1 arg2'"
     """
-    # Set a fixed number of decimal points for floats.
-    posargs = (
-        "{:.{p}f}".format(arg, p=prec) if isinstance(arg, float) else arg
-        for arg in posargs
-    )
-    # Convert `True` to 1 and `False` to 0.
-    posargs = (int(arg) if isinstance(arg, bool) else arg for arg in posargs)
-    return shlex.join(str(arg) for arg in posargs)
+    return shlex.join(posargs2list(posargs, prec=prec))
 
 
 def read_config(conf_file="hpcssrc.ini"):
@@ -0,0 +1,384 @@
+# MIT License
+# Copyright (c) 2021, 2022  All authors listed in the file AUTHORS.rst
+
+
+"""
+Python functions to submit job scripts to the |Slurm| Workload Manager.
+
+All functions that call |sbatch| start it with the absolute path of the
+executable and with ``close_fds=False``.  This lets :mod:`subprocess`
+start |sbatch| via :func:`os.posix_spawn` instead of forking the Python
+interpreter.  All file descriptors opened by Python are
+non-inheritable anyway.
+"""
+
+
+# Standard libraries
+import functools
+import shutil
+import subprocess as subproc
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+# Third-party libraries
+import opthandler
+
+
+@functools.lru_cache(maxsize=None)
+def _sbatch_exe():
+    """
+    Get the absolute path of the |sbatch| executable.
+
+    Returns
+    -------
+    sbatch_exe : str
+        The absolute path of |sbatch| or just ``'sbatch'`` if |sbatch|
+        cannot be found in PATH.
+
+    Notes
+    -----
+    PATH is only searched on the first call.
+    """
+    return shutil.which("sbatch") or "sbatch"
+
+
+def sbatch_cmd(sbatch_opts, parsable=False):
+    r"""
+    Get the |sbatch| command including the given options.
+
+    Parameters
+    ----------
+    sbatch_opts : dict
+        Dictionary containing options to parse to |sbatch|.  Options
+        whose value is ``None`` or ``False`` are skipped.  Options whose
+        value is ``True`` are given without value.
+    parsable : bool, optional
+        If ``True``, add the \--parsable option so that |sbatch| only
+        prints the job ID (and the cluster name, if any).
+
+    Returns
+    -------
+    sbatch_cmd : list
+        The |sbatch| command and the given options as list of
+        arguments.  Job scripts and their positional arguments can
+        simply be appended.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from slurm import sbatch_cmd
+
+    >>> sbatch_opts = {'time': '1:00:00', 'exclusive': True, 'd': None}
+    >>> cmd = sbatch_cmd(sbatch_opts, parsable=True)
+    >>> cmd[0].endswith('sbatch')
+    True
+    >>> cmd[1:]
+    ['--parsable', '--time', '1:00:00', '--exclusive']
+    """
+    cmd = [_sbatch_exe()]
+    if parsable:
+        cmd.append("--parsable")
+    cmd += opthandler.optdict2list(
+        sbatch_opts, skiped_opts=("None", "False"), dumped_vals=("True",)
+    )
+    return cmd
+
+
+def _default_opts(sbatch_opts):
+    """
+    Check whether the job name and the output file must be set.
+
+    Parameters
+    ----------
+    sbatch_opts : dict
+        Dictionary containing options to parse to |sbatch|.
+
+    Returns
+    -------
+    set_jobname : bool
+        ``True`` if `sbatch_opts` contains neither "job-name" nor "J".
+    set_output : bool
+        ``True`` if `sbatch_opts` contains neither "output" nor "o".
+    """
+    set_jobname = "job-name" not in sbatch_opts and "J" not in sbatch_opts
+    set_output = "output" not in sbatch_opts and "o" not in sbatch_opts
+    return set_jobname, set_output
+
+
+def job_cmd(sbatch_opts, job_script, posargs, jobname, parsable=False):
+    r"""
+    Assemble the |sbatch| command to submit a job script.
+
+    Parameters
+    ----------
+    sbatch_opts : dict
+        Dictionary containing options to parse to |sbatch|.
+    job_script : str
+        The job script to submit.
+    posargs : list
+        The positional arguments of the job script as list of strings.
+    jobname : str
+        The job name.  Unless `sbatch_opts` already contains a job name
+        or an output file, the job name is parsed to |sbatch| via
+        \--job-name and the output file is set to
+        ``jobname + '_slurm-%j.out'``.
+    parsable : bool, optional
+        If ``True``, add the \--parsable option.  See
+        :func:`sbatch_cmd`.
+
+    Returns
+    -------
+    job_cmd : list
+        The submit command as list of arguments that can be directly
+        parsed to :func:`submit` or :func:`submit_parsable`.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from slurm import job_cmd
+
+    >>> cmd = job_cmd({'time': '1:00:00'}, 'job.sh', ['a', '1'], 'job')
+    >>> cmd[1:]  # doctest: +NORMALIZE_WHITESPACE
+    ['--time', '1:00:00', '--job-name', 'job', '--output',
+     'job_slurm-%j.out', 'job.sh', 'a', '1']
+    >>> cmd = job_cmd({'J': 'name'}, 'job.sh', [], 'job', parsable=True)
+    >>> cmd[1:]  # doctest: +NORMALIZE_WHITESPACE
+    ['--parsable', '-J', 'name', '--output', 'job_slurm-%j.out',
+     'job.sh']
+    """
+    cmd = sbatch_cmd(sbatch_opts, parsable=parsable)
+    set_jobname, set_output = _default_opts(sbatch_opts)
+    if set_jobname:
+        cmd += ["--job-name", jobname]
+    if set_output:
+        cmd += ["--output", jobname + "_slurm-%j.out"]
+    cmd += [job_script] + list(posargs)
+    return cmd
+
+
+def submit_discretized(
+    sbatch_opts, job_script, posargs, jobname, bins, prec=3, unit=""
+):
+    """
+    Submit a job script for each bin in `bins`.
+
+    The lower and upper edge of each bin are appended to the positional
+    arguments of the job script and to the job name.
+
+    Parameters
+    ----------
+    sbatch_opts : dict
+        Dictionary containing options to parse to |sbatch|.
+    job_script : str
+        The job script which should be submitted for each bin in `bins`.
+    posargs : list
+        The positional arguments of the job script as list of strings
+        without the bin edges.
+    jobname : str
+        The job name without the bin edges.  See :func:`job_cmd`.
+    bins : list or tuple
+        List containing the bin edges.
+    prec : int, optional
+        The number of decimal places of the bin edges.
+    unit : str, optional
+        The unit of the bin edges.  The unit is only appended to the
+        job name.
+
+    Returns
+    -------
+    n_jobs_submitted : int
+        The number of submitted jobs.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If |sbatch| exits with a non-zero exit code.
+    """
+    # Everything that does not depend on the bin is assembled only once
+    # outside the loop over all bins.
+    sbatch = sbatch_cmd(sbatch_opts)
+    set_jobname, set_output = _default_opts(sbatch_opts)
+    script_and_posargs = [job_script] + list(posargs)
+    # Format each bin edge only once.  The formatted edges are used for
+    # the job name and as positional arguments of the job script.
+    edge_fmt = "{{:.{}f}}".format(prec)
+    bins = [edge_fmt.format(edge) for edge in bins]
+
+    n_jobs_submitted = 0
+    for start, stop in zip(bins[:-1], bins[1:]):
+        # Every command must start from the bare sbatch command,
+        # otherwise the options and positional arguments of all previous
+        # bins would be parsed to sbatch, too.
+        jobname_bin = jobname + "_" + start + "-" + stop + unit
+        cmd = list(sbatch)
+        if set_jobname:
+            cmd += ["--job-name", jobname_bin]
+        if set_output:
+            cmd += ["--output", jobname_bin + "_slurm-%j.out"]
+        cmd += script_and_posargs
+        cmd += [start, stop]
+        submit(cmd)
+        n_jobs_submitted += 1
+    return n_jobs_submitted
+
+
+def submit(cmd):
+    """
+    Run an |sbatch| command.
+
+    Parameters
+    ----------
+    cmd : list
+        The |sbatch| command as list of arguments, e.g. as returned by
+        :func:`sbatch_cmd` plus the job script and its positional
+        arguments.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If |sbatch| exits with a non-zero exit code.
+
+    See Also
+    --------
+    :func:`submit_parsable` :
+        Run an |sbatch| command and return the job ID
+
+    Notes
+    -----
+    The output of |sbatch| is discarded.  Error messages are still
+    printed, because the standard error stream is not captured.
+    """
+    subproc.run(cmd, check=True, stdout=subproc.DEVNULL, close_fds=False)
+
+
+def submit_parsable(cmd):
+    r"""
+    Run an |sbatch| command and return the job ID.
+
+    Parameters
+    ----------
+    cmd : list
+        The |sbatch| command as list of arguments.  The command must
+        contain the \--parsable option, e.g. as returned by
+        :func:`sbatch_cmd` with ``parsable=True``.
+
+    Returns
+    -------
+    job_id : int
+        The ID of the submitted job.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If |sbatch| exits with a non-zero exit code.
+
+    See Also
+    --------
+    :func:`submit` :
+        Run an |sbatch| command
+    """
+    # With --parsable, sbatch prints "jobid[;cluster]".  int() accepts
+    # bytes, so there is no need to decode the output.
+    job_id = subproc.check_output(cmd, close_fds=False)
+    return int(job_id.split(b";", 1)[0])
+
+
+def submit_jobs(submit_fn, jobs, max_workers=1):
+    """
+    Submit multiple independent jobs.
+
+    Parameters
+    ----------
+    submit_fn : callable
+        The function that submits a single job.  It is called as
+        ``submit_fn(sbatch_opts, job_script)`` and must return the
+        number of submitted jobs.
+    jobs : iterable
+        The jobs to submit as (sbatch options, job script) pairs.
+    max_workers : int, optional
+        Maximum number of jobs that are submitted concurrently.  If
+        ``1``, the jobs are submitted one after another in the given
+        order.  Otherwise, the submission order is undefined.
+
+    Returns
+    -------
+    n_jobs_submitted : int
+        The total number of submitted jobs.
+
+    Raises
+    ------
+    RuntimeError
+        If the submission of any job failed.  No further jobs are
+        submitted after the first failure.  Jobs that are already being
+        submitted concurrently are completed.  The error message lists
+        all job scripts whose submission failed and the number of jobs
+        that were not submitted.  The first error is chained to the
+        raised exception.  Error messages of |sbatch| itself are printed
+        to the standard error stream.
+
+    Examples
+    --------
+    .. testsetup::
+
+        from slurm import submit_jobs
+
+    >>> def submit_fn(sbatch_opts, job_script):
+    ...     if job_script == 'fail':
+    ...         raise ValueError('invalid job script')
+    ...     return sbatch_opts['n_jobs']
+    >>> jobs = [({'n_jobs': 1}, 'a'), ({'n_jobs': 3}, 'b')]
+    >>> submit_jobs(submit_fn, jobs)
+    4
+    >>> submit_jobs(submit_fn, jobs, max_workers=2)
+    4
+    >>> jobs.insert(1, ({}, 'fail'))
+    >>> submit_jobs(submit_fn, jobs)
+    Traceback (most recent call last):
+    ...
+    RuntimeError: Could not submit 1 job script(s): 'fail'.  1 further job script(s) were not submitted.  1 job(s) were submitted successfully.
+    """  # noqa: W505,E501
+    jobs = list(jobs)
+    n_jobs_submitted = 0
+    n_not_submitted = 0
+    failed = []
+    if max_workers == 1:
+        for i, (sbatch_opts, job_script) in enumerate(jobs):
+            try:
+                n_jobs_submitted += submit_fn(sbatch_opts, job_script)
+            except Exception as err:
+                failed.append((job_script, err))
+                n_not_submitted = len(jobs) - i - 1
+                break
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(submit_fn, sbatch_opts, job_script)
+                for sbatch_opts, job_script in jobs
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            # Cancel all pending submissions after the first failure.
+            # Running submissions cannot be cancelled.
+            for future in futures:
+                future.cancel()
+        for (_sbatch_opts, job_script), future in zip(jobs, futures):
+            if future.cancelled():
+                n_not_submitted += 1
+            elif future.exception() is not None:
+                failed.append((job_script, future.exception()))
+            else:
+                n_jobs_submitted += future.result()
+    if failed:
+        raise RuntimeError(
+            "Could not submit {} job script(s): {}.  {} further job script(s)"
+            " were not submitted.  {} job(s) were submitted"
+            " successfully.".format(
+                len(failed),
+                ", ".join(
+                    "'{}'".format(job_script) for job_script, _err in failed
+                ),
+                n_not_submitted,
+                n_jobs_submitted,
+            )
+        ) from failed[0][1]
+    return n_jobs_submitted
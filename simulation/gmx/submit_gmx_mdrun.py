@@ -215,8 +215,6 @@ __author__ = "Andreas Thum"
 import argparse
 import glob
 import os
-import shlex
-import subprocess as subproc
 import sys
 import warnings
 
@@ -232,7 +230,7 @@ sys.path.insert(1, PYTHON_DIR)
 # Third-party libraries
 import gmx  # noqa: E402
 import opthandler  # noqa: E402
-import strng  # noqa: E402
+import slurm  # noqa: E402
 
 
 ARG_PREC = 3  # Precision of floats parsed to batch scripts.
@@ -483,10 +481,8 @@ if __name__ == "__main__":  # noqa: C901
         args_sbatch["job-name"] = gmx_infile_pattern
     if "output" not in args_sbatch and "o" not in args_sbatch:
         args_sbatch["output"] = gmx_outfile_pattern + "_slurm-%j.out"
-    sbatch = "sbatch "
-    sbatch += opthandler.optdict2str(
-        args_sbatch, skiped_opts=("None", "False"), dumped_vals=("True",)
-    )
+    # The job ID is only required for resubmissions.
+    sbatch = slurm.sbatch_cmd(args_sbatch, parsable=args["continue"] in (2, 3))
     # Assemble position arguments to parse to the batch script itself
     gmx_lmod = os.path.abspath(
         os.path.join(FILE_ROOT, "../../lmod/" + args["gmx_lmod"])
@@ -519,26 +515,28 @@ if __name__ == "__main__":  # noqa: C901
         args["mdrun_flags"],
         args["grompp_flags"],
     ]
-    posargs = opthandler.posargs2str(posargs_list, prec=ARG_PREC)
+    posargs = opthandler.posargs2list(posargs_list, prec=ARG_PREC)
 
     print("Submitting job(s) to Slurm...")
-    submit = sbatch + " " + BATCH_SCRIPT + " " + posargs
-    job_id = subproc.check_output(shlex.split(submit))
-    if args["continue"] in (2, 3):  # Resubmit
-        job_id = strng.extract_ints_from_str(job_id)[0]
+    submit = sbatch + [BATCH_SCRIPT] + posargs
+    if args["continue"] not in (2, 3):
+        slurm.submit(submit)
+    else:  # Resubmit
+        job_id = slurm.submit_parsable(submit)
         # After the first job submission the following jobs always
         # continue a previous simulation. => The `continue` option of
         # all following jobs must be set to 3.
         posargs_list[4] = 3  # Set `continue` to 3.
-        posargs = opthandler.posargs2str(posargs_list, prec=ARG_PREC)
+        posargs = opthandler.posargs2list(posargs_list, prec=ARG_PREC)
         # After the first job submission the following jobs only depend
         # on the respective previous job => Remove possible dependencies
         # that the user specified for the first job.
-        sbatch = opthandler.rm_option(sbatch, ("--dependency", "-d"))
+        args_sbatch.pop("dependency", None)
+        args_sbatch.pop("d", None)
+        sbatch = slurm.sbatch_cmd(args_sbatch, parsable=True)
         for _ in range(args["nresubmits"]):
-            sbatch_dep = sbatch + " --dependency afterok:{}".format(job_id)
-            submit = sbatch_dep + " " + BATCH_SCRIPT + " " + posargs
-            job_id = subproc.check_output(shlex.split(submit))
-            job_id = strng.extract_ints_from_str(job_id)[0]
+            sbatch_dep = sbatch + ["--dependency", "afterok:{}".format(job_id)]
+            submit = sbatch_dep + [BATCH_SCRIPT] + posargs
+            job_id = slurm.submit_parsable(submit)
 
     print("{} done".format(os.path.basename(sys.argv[0])))